@@ -1,12 +1,16 @@
 # cogs/admin/bot_admin.py
 import discord
+import asyncio
 from discord.ext import commands, tasks
 from discord import app_commands
 import logging
-from typing import Optional
+from typing import Dict, FrozenSet, Optional
 
 from config.personalities import PERSONALITY_RESPONSES
 
+# Set by the BotAdmin cog while it is loaded so the check can skip the get_cog lookup.
+_active_cog: Optional["BotAdmin"] = None
+
 # --- THE NEW, FAST DECORATOR ---
 def is_bot_admin():
     """
@@ -22,7 +26,7 @@ def is_bot_admin():
             return True
         
         # Get the cog to access the cache.
-        cog = interaction.client.get_cog('BotAdmin')
+        cog = _active_cog or interaction.client.get_cog('BotAdmin')
         if not cog:
             # This should ideally never happen if the cog is loaded.
             # We no longer send a message here to prevent other errors.
@@ -32,7 +36,7 @@ def is_bot_admin():
             
         # Rule 2: Perform a FAST, SYNCHRONOUS check against the cache.
         # NO `await` here means NO timeout!
-        guild_admins = cog.admin_cache.get(str(interaction.guild_id), [])
+        guild_admins = cog.admin_cache.get(interaction.guild_id, ())
         
         return interaction.user.id in guild_admins
     
@@ -40,6 +44,8 @@ def is_bot_admin():
 
 
 class BotAdmin(commands.Cog):
+    SAVE_INTERVAL = 2  # Coalesce bursts of /botadmin edits into a single write
+
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger(__name__)
@@ -47,13 +53,54 @@ class BotAdmin(commands.Cog):
         self.data_manager = self.bot.data_manager
 
         # --- NEW: Initialize the admin cache ---
-        self.admin_cache = {}
+        # Admin IDs are stored as lists on disk; the cache holds frozensets for O(1) checks.
+        self.admin_cache: Dict[int, FrozenSet[int]] = {}
+        self._is_dirty = asyncio.Event()
+        self._save_lock = asyncio.Lock()
+        self.save_task: Optional[asyncio.Task] = None
         # --- NEW: Start the background task to update the cache ---
         self.update_admin_cache_task.start()
 
-    def cog_unload(self):
-        """Clean up the task when the cog is unloaded."""
+    async def cog_load(self):
+        global _active_cog
+        _active_cog = self
+        self.save_task = self.bot.loop.create_task(self._periodic_save())
+
+    async def cog_unload(self):
+        """Clean up the tasks and flush any pending admin changes."""
+        global _active_cog
+        if _active_cog is self: _active_cog = None
         self.update_admin_cache_task.cancel()
+        if self.save_task:
+            self.save_task.cancel()
+            try: await self.save_task
+            except asyncio.CancelledError: pass
+        if self._is_dirty.is_set():
+            self.logger.info("Performing final save for bot admin data...")
+            await self._save_admins()
+
+    async def _periodic_save(self):
+        """Background task that writes bot admin data at most once per SAVE_INTERVAL."""
+        while not self.bot.is_closed():
+            try:
+                await self._is_dirty.wait()
+                await asyncio.sleep(self.SAVE_INTERVAL)
+                await self._save_admins()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error in BotAdmin periodic save: {e}", exc_info=True)
+                await asyncio.sleep(self.SAVE_INTERVAL * 2)
+
+    async def _save_admins(self):
+        async with self._save_lock:
+            self._is_dirty.clear()
+            await self.data_manager.save_data("bot_admins", await self.data_manager.get_data("bot_admins"))
+
+    def _refresh_admin_cache(self, bot_admins_data: dict):
+        """Rebuilds the lookup cache from the stored {guild_id: [user_id, ...]} data."""
+        # JSON keys are strings; the cache is keyed by int so checks can use guild.id as-is.
+        self.admin_cache = {int(guild_id): frozenset(admins) for guild_id, admins in bot_admins_data.items()}
 
     # --- NEW: Background task to keep the admin cache fresh ---
     @tasks.loop(seconds=60)
@@ -61,7 +108,7 @@ class BotAdmin(commands.Cog):
         """Periodically loads bot admin data into a fast in-memory cache."""
         try:
             # The slow I/O operation happens here, safely in the background.
-            self.admin_cache = await self.data_manager.get_data("bot_admins")
+            self._refresh_admin_cache(await self.data_manager.get_data("bot_admins"))
         except Exception as e:
             self.logger.error(f"Failed to update bot admin cache: {e}")
 
@@ -78,7 +125,7 @@ class BotAdmin(commands.Cog):
             return True
         
         # Use the fast cache for prefix commands too
-        guild_admins = self.admin_cache.get(str(ctx.guild.id), [])
+        guild_admins = self.admin_cache.get(ctx.guild.id, ())
         return ctx.author.id in guild_admins
 
     @app_commands.command(name="botadmin", description="Manage who can use Tika's admin commands.")
@@ -101,16 +148,17 @@ class BotAdmin(commands.Cog):
         guild_id = str(interaction.guild.id)
         # We still need to fetch the real data to modify it
         bot_admins_data = await self.data_manager.get_data("bot_admins")
-        guild_admins = bot_admins_data.setdefault(guild_id, [])
+        # Only "add" creates the guild entry; remove/list must not leave empty lists behind.
+        guild_admins = bot_admins_data.get(guild_id, [])
 
         if action == "add":
             if user.id in guild_admins:
                 await interaction.followup.send(self.personality["already_admin"], ephemeral=True)
                 return
-            guild_admins.append(user.id)
-            await self.data_manager.save_data("bot_admins", bot_admins_data)
-            # --- NEW: Immediately update the cache after making a change ---
-            self.admin_cache = bot_admins_data
+            bot_admins_data.setdefault(guild_id, guild_admins).append(user.id)
+            # The cache is updated immediately; the write itself is debounced.
+            self._refresh_admin_cache(bot_admins_data)
+            self._is_dirty.set()
             await interaction.followup.send(self.personality["admin_added"].format(user=user.display_name))
         
         elif action == "remove":
@@ -119,9 +167,9 @@ class BotAdmin(commands.Cog):
                 return
             guild_admins.remove(user.id)
             if not guild_admins: del bot_admins_data[guild_id]
-            await self.data_manager.save_data("bot_admins", bot_admins_data)
-            # --- NEW: Immediately update the cache after making a change ---
-            self.admin_cache = bot_admins_data
+            # The cache is updated immediately; the write itself is debounced.
+            self._refresh_admin_cache(bot_admins_data)
+            self._is_dirty.set()
             await interaction.followup.send(self.personality["admin_removed"].format(user=user.display_name))
 
         elif action == "list":
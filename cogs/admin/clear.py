@@ -24,8 +24,9 @@ class SearchConfirmationView(discord.ui.View):
 
     async def _bulk_delete_messages(self, channel: discord.TextChannel) -> int:
         cutoff = discord.utils.utcnow() - timedelta(days=14)
-        recent = [msg for msg in self.messages_to_delete if msg.created_at > cutoff]
-        old = [msg for msg in self.messages_to_delete if msg.created_at <= cutoff]
+        recent, old = [], []
+        for msg in self.messages_to_delete:
+            (recent if msg.created_at > cutoff else old).append(msg)
         
         deleted_count = 0
         if recent:
@@ -172,13 +173,21 @@ class Clear(commands.Cog):
         try:
             matcher = self._message_matcher.get_matcher(target, match_type)
             matched = []
+            append = matched.append
             scanned = 0
+            report_progress = limit > 2000
+            user_id = user.id if user else None
+            default_type = discord.MessageType.default
+            # Only the literal matchers need text; a regex like `.*` or `^$` also matches empty content
+            skip_empty = match_type != "regex"
             async for msg in interaction.channel.history(limit=limit):
                 scanned += 1
-                if limit > 2000 and scanned % 1000 == 0: await interaction.edit_original_response(content=f"🔍 Searching... (Scanned {scanned}/{limit} messages)")
-                if user and msg.author.id != user.id: continue
-                if msg.type != discord.MessageType.default: continue
-                if matcher(msg.content): matched.append(msg)
+                if report_progress and scanned % 1000 == 0: await interaction.edit_original_response(content=f"🔍 Searching... (Scanned {scanned}/{limit} messages)")
+                if user_id and msg.author.id != user_id: continue
+                if msg.type is not default_type: continue
+                content = msg.content
+                # Embed/attachment-only messages can't match a literal target; skip the matcher's lower() work
+                if (content or not skip_empty) and matcher(content): append(msg)
         except ValueError as e: return await interaction.edit_original_response(content=str(e))
         except Exception: return await interaction.edit_original_response(content=self.personality["error_general"])
         if not matched: return await interaction.edit_original_response(content=self.personality["search_no_matches"].format(target=target))
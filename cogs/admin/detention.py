@@ -3,24 +3,87 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
+import asyncio
 import time
-from typing import Optional, Dict
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, List, Set, Tuple
 
 from config.personalities import PERSONALITY_RESPONSES
 from cogs.admin.bot_admin import is_bot_admin
 
+@dataclass(slots=True)
+class DetentionRecord:
+    sentence: str
+    reps_remaining: int
+    total_reps: int
+    start_timestamp: int
+    original_roles: List[int] = field(default_factory=list)
+    pin_message_id: Optional[int] = None
+    detained_by_id: Optional[int] = None
+    # Runtime only: the progress embed, patched in place on each rep and never saved
+    embed: Optional[discord.Embed] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DetentionRecord":
+        """Build a record from saved JSON, ignoring keys the record does not store."""
+        return cls(**{name: data[name] for name in _PERSISTED_FIELDS if name in data})
+
+_PERSISTED_FIELDS = tuple(f.name for f in fields(DetentionRecord) if f.name != "embed")
+
+# Fallbacks for personality lines, as plain templates filled in with .format()
+_DEFAULT_TEMPLATES = {
+    "no_channel_set": "Detention channel not configured. Use `/detention-settings set-channel` first.",
+    "detention_start": "{user} has been placed in detention in {channel}",
+    "not_detained": "{user} is not in detention.",
+    "detention_released": "{user} has been released from detention.",
+    "channel_set": "Detention channel set to {channel}",
+    "no_one_detained": "No one is currently in detention.",
+    "detention_done": "{user} has completed their detention!",
+}
+
 class Detention(commands.Cog):
+    # Class constants
+    SAVE_INTERVAL = 300  # Compact the event log into the guild shards this often (seconds)
+    EVENT_LOG = "detention_events"
+    PROGRESS_UPDATE_EVERY = 5  # Edit the pinned progress embed once per this many reps
+
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger(__name__)
         self.personality = PERSONALITY_RESPONSES["detention"]
+        # Resolved once so replies don't rebuild their fallback strings on every call
+        self.templates = {key: self.personality.get(key, default) for key, default in _DEFAULT_TEMPLATES.items()}
         self.data_manager = self.bot.data_manager
-        self.detention_cache: Dict[str, Dict] = {}
+        # Keyed by integer guild/user ids; ids are only stringified for JSON
+        self.detention_cache: Dict[int, Dict[int, DetentionRecord]] = {}
+        # guild_id -> detained user ids; lets the message hook skip everyone else with one set lookup
+        self._detained_index: Dict[int, Set[int]] = {}
+        # Shared with other cogs in its on-disk (string keyed) form
         self.settings_cache: Dict[str, Dict] = {}
+        # Every configured detention channel, so reps are checked with one int lookup
+        self._detention_channel_ids: Set[int] = set()
+        # Per-user locks so near-simultaneous messages cannot both pass the
+        # completion check and release the same user twice.
+        self._locks: Dict[Tuple[int, int], asyncio.Lock] = {}
+
+        # Persistent save system. Rep progress and releases are appended to a
+        # small event log (data/detention_events.log) and mark their guild
+        # dirty; the background task periodically rewrites just those guilds'
+        # shards (data/detention_data/<guild_id>.json) and drops the log.
+        self._is_dirty = asyncio.Event()
+        self._dirty_guilds: Set[int] = set()
+        # Set while the legacy single-file data still has guilds not yet written as shards
+        self._legacy_pending = False
+        self._save_lock = asyncio.Lock()
+        self.save_task: Optional[asyncio.Task] = None
+        # Resolved on first use; cogs are loaded once at startup and never reloaded
+        self._feature_manager = None
     
     async def _is_feature_enabled(self, interaction: discord.Interaction) -> bool:
         """Check if detention system is enabled for this guild."""
-        feature_manager = self.bot.get_cog("FeatureManager")
+        feature_manager = self._feature_manager
+        if feature_manager is None:
+            feature_manager = self._feature_manager = self.bot.get_cog("FeatureManager")
         if not feature_manager or not feature_manager.is_feature_enabled(interaction.guild_id, "detention_system"):
             await interaction.response.send_message(
                 "The detention system is disabled on this server.", 
@@ -30,46 +93,211 @@ class Detention(commands.Cog):
         return True
 
     async def cog_load(self):
-        """Load detention data into memory on cog initialization."""
+        """Load detention data into memory on cog initialization.
+
+        This is the only place either dataset is read. Afterwards the
+        in-memory caches are authoritative: every change is made on them in
+        process and written back, so message handlers never read from disk.
+        Events logged since the last snapshot are replayed over the shards.
+        """
         self.logger.info("Loading detention data...")
-        self.detention_cache = await self.data_manager.get_data("detention_data")
+        raw_detentions = await self.data_manager.get_shards("detention_data")
+        # Older installs kept every guild in a single detention_data.json. It is only
+        # emptied once all its guilds have been written as shards, so a partial
+        # migration is resumed here; guilds that already have a shard keep it.
+        legacy = await self.data_manager.get_data("detention_data")
+        migrated = bool(legacy)
+        if migrated:
+            raw_detentions = {**legacy, **raw_detentions}
+        self.detention_cache = {
+            int(guild_id): {int(user_id): DetentionRecord.from_dict(data) for user_id, data in users.items()}
+            for guild_id, users in raw_detentions.items()
+        }
+        replayed = await self._replay_events()
+        self._detained_index = {
+            guild_id: set(users) for guild_id, users in self.detention_cache.items()
+        }
+        # Shared reference with the other role cogs; never re-fetched or copied
         self.settings_cache = await self.data_manager.get_data("role_settings")
+        self._detention_channel_ids = {
+            settings["detention_channel_id"]
+            for settings in self.settings_cache.values()
+            if settings.get("detention_channel_id")
+        }
+
+        if migrated:
+            self._dirty_guilds.update(self.detention_cache)
+            self._legacy_pending = True
+            if await self._flush_now():
+                self.logger.info(f"Migrated detention data for {len(self.detention_cache)} guild(s) to per-guild shards.")
+            else:
+                # The legacy file stays until a retry writes every shard
+                self.logger.error("Detention shard migration incomplete; keeping legacy detention_data.json.")
+        elif replayed:
+            await self._flush_now()
+            self.logger.info(f"Replayed {replayed} detention event(s) from the event log.")
+
+        self.save_task = self.bot.loop.create_task(self._periodic_save())
         self.logger.info("Detention data loaded.")
 
+    async def cog_unload(self):
+        """Cancel the save task and flush any unsaved detention progress."""
+        if self.save_task:
+            self.save_task.cancel()
+            try:
+                await self.save_task
+            except asyncio.CancelledError:
+                pass
+
+        if self._is_dirty.is_set():
+            self.logger.info("Performing final save for detention data...")
+            await self._flush_now()
+
+    async def _replay_events(self) -> int:
+        """Apply logged events on top of the loaded shards. Events carry absolute values, so replaying twice is harmless."""
+        events = await self.data_manager.read_events(self.EVENT_LOG)
+        for event in events:
+            guild_id, user_id = event.get("g"), event.get("u")
+            users = self.detention_cache.get(guild_id)
+            if not users or user_id not in users:
+                continue
+            if event.get("t") == "rep":
+                users[user_id].reps_remaining = event["r"]
+            elif event.get("t") == "release":
+                del users[user_id]
+            self._dirty_guilds.add(guild_id)
+        return len(events)
+
+    async def _log_event(self, event: Dict):
+        """Record a change in the event log and queue its guild for the next snapshot."""
+        self._mark_dirty(event["g"])
+        await self.data_manager.append_event(self.EVENT_LOG, event)
+
+    def _mark_dirty(self, guild_id: int):
+        """Queue a guild's shard for the next background save."""
+        self._dirty_guilds.add(guild_id)
+        self._is_dirty.set()
+
+    async def _flush_now(self) -> bool:
+        """Write detention data immediately, absorbing any pending batched save. Returns whether every shard was written."""
+        async with self._save_lock:
+            self._is_dirty.clear()
+            return await self._write_dirty_shards()
+
+    async def _write_dirty_shards(self) -> bool:
+        """Rewrite the shard of every dirty guild and drop the events they cover. Caller must hold the save lock."""
+        # Rotate first: anything logged from here on lands in the fresh log and
+        # marks the new dirty set, so it survives this snapshot either way.
+        await self.data_manager.rotate_events(self.EVENT_LOG)
+        dirty, self._dirty_guilds = self._dirty_guilds, set()
+        failed = set()
+        for guild_id in dirty:
+            users = self.detention_cache.get(guild_id)
+            if users:
+                written = await self.data_manager.save_shard("detention_data", str(guild_id), self._serialize_guild(users))
+            else:
+                written = await self.data_manager.delete_shard("detention_data", str(guild_id))
+            if not written:
+                failed.add(guild_id)
+        if failed:
+            # Keep the rotated log (the next rotation appends to it) and retry these guilds
+            self._dirty_guilds.update(failed)
+            self._is_dirty.set()
+            self.logger.warning(f"Failed to write detention shards for {len(failed)} guild(s); will retry.")
+            return False
+        await self.data_manager.discard_rotated_events(self.EVENT_LOG)
+        if self._legacy_pending:
+            # Every migrated guild now has a shard; empty the legacy file so it is never loaded again
+            await self.data_manager.save_data("detention_data", {})
+            self._legacy_pending = False
+        return True
+
+    async def _periodic_save(self):
+        """Background task that writes detention data only when it has changed."""
+        while not self.bot.is_closed():
+            try:
+                await self._is_dirty.wait()
+                await asyncio.sleep(self.SAVE_INTERVAL)
+
+                async with self._save_lock:
+                    self._is_dirty.clear()
+                    await self._write_dirty_shards()
+                    self.logger.debug("Saved detention data")
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error in detention periodic save: {e}", exc_info=True)
+                await asyncio.sleep(self.SAVE_INTERVAL * 2)
+
+    def _guild_settings(self, guild_id: int) -> Dict:
+        """Read-only view of a guild's role settings from the in-memory cache."""
+        return self.settings_cache.get(str(guild_id), {})
+
+    @staticmethod
+    def _serialize_guild(users: Dict[int, DetentionRecord]) -> Dict[str, Dict]:
+        """Convert one guild's in-memory records into plain dicts for saving."""
+        return {
+            str(user_id): {name: getattr(record, name) for name in _PERSISTED_FIELDS}
+            for user_id, record in users.items()
+        }
+
     async def is_user_detained(self, message: discord.Message) -> bool:
         """Check if a user is currently in detention."""
-        if not message.guild:
-            return False
-        guild_detentions = self.detention_cache.get(str(message.guild.id), {})
-        return str(message.author.id) in guild_detentions
+        return message.guild is not None and message.author.id in self._detained_index.get(message.guild.id, ())
 
     async def handle_detention_message(self, message: discord.Message):
         """Process messages from detained users."""
         if not message.guild:
             return
             
-        guild_id = str(message.guild.id)
-        user_id = str(message.author.id)
+        guild_id = message.guild.id
+        user_id = message.author.id
+        if user_id not in self._detained_index.get(guild_id, ()):
+            return
         
         user_data = self.detention_cache.get(guild_id, {}).get(user_id)
         if not user_data:
             return
 
-        # Check if message matches the required sentence
-        if message.content.strip() == user_data["sentence"]:
-            user_data["reps_remaining"] -= 1
-            
+        # Reps only count in the detention channel; anything said elsewhere is removed unread
+        if message.channel.id not in self._detention_channel_ids:
             try:
-                await message.add_reaction("✅")
-            except discord.Forbidden:
+                await message.delete()
+            except (discord.Forbidden, discord.NotFound):
                 pass
-            
-            # Check if detention is complete
-            if user_data["reps_remaining"] <= 0:
-                await self._release_from_detention(message.guild, message.author, completed=True)
-            else:
-                await self._update_pinned_message(message.guild, message.author)
-                await self.data_manager.save_data("detention_data", self.detention_cache)
+            return
+
+        # Check if message matches the required sentence. Stripping can only
+        # shorten the content, so anything shorter than the sentence is wrong.
+        content = message.content
+        if len(content) >= len(user_data.sentence) and content.strip() == user_data.sentence:
+            key = (guild_id, user_id)
+            # Only allocate a Lock the first time; setdefault would build one per rep
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = asyncio.Lock()
+            async with lock:
+                # Re-check after acquiring: another message may have finished the detention
+                user_data = self.detention_cache.get(guild_id, {}).get(user_id)
+                if not user_data:
+                    return
+
+                user_data.reps_remaining -= 1
+                # One short log line per rep; a restart replays it over the last snapshot
+                await self._log_event({"t": "rep", "g": guild_id, "u": user_id, "r": user_data.reps_remaining})
+                
+                try:
+                    await message.add_reaction("✅")
+                except discord.Forbidden:
+                    pass
+                
+                # Check if detention is complete
+                if user_data.reps_remaining <= 0:
+                    await self._release_from_detention(message.guild, message.author, completed=True)
+                elif (user_data.total_reps - user_data.reps_remaining) % self.PROGRESS_UPDATE_EVERY == 0:
+                    # The ✅ reaction acknowledges every rep; the pin only needs periodic refreshes
+                    await self._update_pinned_message(message.guild, message.author)
         else:
             # Wrong message - delete it
             try:
@@ -79,8 +307,7 @@ class Detention(commands.Cog):
 
     def _get_detention_role(self, guild: discord.Guild) -> Optional[discord.Role]:
         """Get the configured detention role for this guild."""
-        guild_id = str(guild.id)
-        role_id = self.settings_cache.get(guild_id, {}).get("detention_role_id")
+        role_id = self._guild_settings(guild.id).get("detention_role_id")
         
         if not role_id:
             return None
@@ -125,6 +352,10 @@ class Detention(commands.Cog):
         repetitions: Optional[int]
     ):
         """Start a detention session for a user."""
+        # Stored stripped, since replies are compared after stripping
+        if sentence:
+            sentence = sentence.strip()
+        
         # Validate inputs
         if not sentence or not repetitions:
             return await interaction.followup.send(
@@ -132,8 +363,11 @@ class Detention(commands.Cog):
                 ephemeral=True
             )
         
-        guild_id = str(interaction.guild.id)
-        user_id = str(user.id)
+        guild_id = interaction.guild.id
+        user_id = user.id
+        guild_settings = self._guild_settings(guild_id)
+        channel_id = guild_settings.get("detention_channel_id")
+        booster_role_id = guild_settings.get("booster_role_id")
         
         # Check if user is already detained
         if user_id in self.detention_cache.get(guild_id, {}):
@@ -158,10 +392,9 @@ class Detention(commands.Cog):
             )
         
         # Get detention channel
-        channel_id = self.settings_cache.get(guild_id, {}).get("detention_channel_id")
         if not channel_id:
             return await interaction.followup.send(
-                self.personality.get("no_channel_set", "Detention channel not configured. Use `/detention-settings set-channel` first."), 
+                self.templates["no_channel_set"], 
                 ephemeral=True
             )
         
@@ -187,54 +420,30 @@ class Detention(commands.Cog):
                 ephemeral=True
             )
         
-        # Step 1: Save original roles (excluding @everyone and booster role)
-        booster_role_id = self.settings_cache.get(guild_id, {}).get("booster_role_id")
+        # Save original roles (excluding @everyone and booster role).
+        # The @everyone role always shares the guild's id.
+        everyone_id = interaction.guild.id
+        user_role_ids = {r.id for r in user.roles}
         original_roles = [
             r.id for r in user.roles 
-            if not r.is_default() and r.id != booster_role_id
+            if r.id != everyone_id and r.id != booster_role_id
         ]
         self.logger.info(f"[Detention] Saved {len(original_roles)} roles for {user.display_name} (excluded booster role)")
         
-        # Step 2: Remove all roles except booster role
-        booster_role_id = self.settings_cache.get(guild_id, {}).get("booster_role_id")
+        # Replace all roles with the detention role (keeping booster role) in a single request
         booster_role = interaction.guild.get_role(booster_role_id) if booster_role_id else None
-        
-        roles_to_keep = [booster_role] if booster_role and booster_role in user.roles else []
+        roles_to_keep = [booster_role] if booster_role and booster_role_id in user_role_ids else []
         
         try:
-            await user.edit(roles=roles_to_keep, reason=f"Detention by {interaction.user.display_name} - removing roles")
-            self.logger.info(f"[Detention] Removed all roles from {user.display_name} (kept booster role)")
+            await user.edit(roles=roles_to_keep + [detention_role], reason=f"Detention by {interaction.user.display_name}")
+            self.logger.info(f"[Detention] Applied detention role to {user.display_name} (kept booster role)")
         except discord.Forbidden:
             return await interaction.followup.send(
                 f"Cannot manage roles for {user.mention}.", 
                 ephemeral=True
             )
         except discord.HTTPException as e:
-            self.logger.error(f"[Detention] Failed to remove roles from {user.display_name}: {e}")
-            return await interaction.followup.send(
-                f"Failed to manage roles for {user.mention}.", 
-                ephemeral=True
-            )
-        
-        # Step 3: Apply the detention role (in addition to booster role if kept)
-        roles_to_apply = roles_to_keep + [detention_role]
-        try:
-            await user.edit(roles=roles_to_apply, reason=f"Detention by {interaction.user.display_name}")
-            self.logger.info(f"[Detention] Applied detention role to {user.display_name}")
-        except discord.Forbidden:
-            # Try to restore original roles if this fails
-            self.logger.error(f"[Detention] Failed to apply detention role to {user.display_name}, restoring original roles")
-            try:
-                restore_roles = [interaction.guild.get_role(rid) for rid in original_roles if interaction.guild.get_role(rid)]
-                await user.edit(roles=restore_roles, reason="Detention failed - restoring roles")
-            except:
-                pass
-            return await interaction.followup.send(
-                f"Failed to assign detention role to {user.mention}.", 
-                ephemeral=True
-            )
-        except discord.HTTPException as e:
-            self.logger.error(f"[Detention] HTTP error applying detention role to {user.display_name}: {e}")
+            self.logger.error(f"[Detention] Failed to apply detention roles to {user.display_name}: {e}")
             return await interaction.followup.send(
                 f"Failed to assign detention role to {user.mention}.", 
                 ephemeral=True
@@ -257,20 +466,25 @@ class Detention(commands.Cog):
         
         # Save to cache
         guild_detentions = self.detention_cache.setdefault(guild_id, {})
-        guild_detentions[user_id] = {
-            "sentence": sentence,
-            "reps_remaining": repetitions,
-            "total_reps": repetitions,
-            "original_roles": original_roles,
-            "pin_message_id": pin_message_id,
-            "detained_by_id": interaction.user.id,
-            "start_timestamp": int(time.time())
-        }
+        guild_detentions[user_id] = DetentionRecord(
+            sentence=sentence,
+            reps_remaining=repetitions,
+            total_reps=repetitions,
+            original_roles=original_roles,
+            pin_message_id=pin_message_id,
+            detained_by_id=interaction.user.id,
+            start_timestamp=int(time.time()),
+            embed=embed
+        )
+        self._detained_index.setdefault(guild_id, set()).add(user_id)
         
-        await self.data_manager.save_data("detention_data", self.detention_cache)
+        # Written right away: this record holds the only copy of the member's
+        # original roles. Any progress waiting on the periodic save goes with it.
+        self._dirty_guilds.add(guild_id)
+        await self._flush_now()
         
         await interaction.followup.send(
-            self.personality.get("detention_start", f"{user.mention} has been placed in detention in {detention_channel.mention}").format(
+            self.templates["detention_start"].format(
                 user=user.mention, 
                 channel=detention_channel.mention
             )
@@ -278,18 +492,18 @@ class Detention(commands.Cog):
 
     async def _release_detention(self, interaction: discord.Interaction, user: discord.Member):
         """Manually release a user from detention."""
-        guild_id = str(interaction.guild.id)
-        user_id = str(user.id)
+        guild_id = interaction.guild.id
+        user_id = user.id
         
         if user_id not in self.detention_cache.get(guild_id, {}):
             return await interaction.followup.send(
-                self.personality.get("not_detained", f"{user.mention} is not in detention."), 
+                self.templates["not_detained"].format(user=user.mention), 
                 ephemeral=True
             )
         
         await self._release_from_detention(interaction.guild, user, completed=False)
         await interaction.followup.send(
-            self.personality.get("detention_released", f"{user.mention} has been released from detention.").format(user=user.mention)
+            self.templates["detention_released"].format(user=user.mention)
         )
 
     @app_commands.command(name="detention-settings", description="Configure detention system.")
@@ -331,11 +545,13 @@ class Detention(commands.Cog):
                 )
             
             guild_settings = self.settings_cache.setdefault(guild_id, {})
+            self._detention_channel_ids.discard(guild_settings.get("detention_channel_id"))
+            self._detention_channel_ids.add(channel.id)
             guild_settings["detention_channel_id"] = channel.id
             await self.data_manager.save_data("role_settings", self.settings_cache)
             
             await interaction.followup.send(
-                self.personality.get("channel_set", f"Detention channel set to {channel.mention}").format(channel=channel.mention)
+                self.templates["channel_set"].format(channel=channel.mention)
             )
         
         elif action == "set-role":
@@ -370,7 +586,7 @@ class Detention(commands.Cog):
             await interaction.followup.send(f"Server booster role set to {role.mention}\n*This role will be preserved during detention.*")
         
         elif action == "view":
-            guild_settings = self.settings_cache.get(guild_id, {})
+            guild_settings = self._guild_settings(guild_id)
             
             channel_id = guild_settings.get("detention_channel_id")
             role_id = guild_settings.get("detention_role_id")
@@ -403,10 +619,10 @@ class Detention(commands.Cog):
             await interaction.followup.send(embed=embed)
         
         elif action == "list":
-            detained = self.detention_cache.get(guild_id, {})
+            detained = self.detention_cache.get(interaction.guild.id, {})
             if not detained:
                 return await interaction.followup.send(
-                    self.personality.get("no_one_detained", "No one is currently in detention.")
+                    self.templates["no_one_detained"]
                 )
             
             embed = discord.Embed(
@@ -414,17 +630,18 @@ class Detention(commands.Cog):
                 color=discord.Color.orange()
             )
             
-            for user_id_str, data in detained.items():
-                member = interaction.guild.get_member(int(user_id_str))
-                name = member.display_name if member else f"User {user_id_str}"
+            get_member = interaction.guild.get_member
+            for detained_id, data in detained.items():
+                member = get_member(detained_id)
+                name = member.display_name if member else f"User {detained_id}"
                 
-                detained_by = interaction.guild.get_member(data.get("detained_by_id"))
+                detained_by = get_member(data.detained_by_id)
                 detained_by_name = detained_by.display_name if detained_by else "Unknown"
                 
                 value = (
-                    f"**Progress:** {data['total_reps'] - data['reps_remaining']} / {data['total_reps']}\n"
+                    f"**Progress:** {data.total_reps - data.reps_remaining} / {data.total_reps}\n"
                     f"**Detained by:** {detained_by_name}\n"
-                    f"**Started:** <t:{data['start_timestamp']}:R>"
+                    f"**Started:** <t:{data.start_timestamp}:R>"
                 )
                 
                 embed.add_field(name=name, value=value, inline=False)
@@ -456,71 +673,89 @@ class Detention(commands.Cog):
         )
         return embed
 
+    def _set_embed_progress(self, embed: discord.Embed, remaining: int, total: int):
+        """Patch the Progress field of a cached detention embed in place."""
+        embed.set_field_at(
+            1,
+            name="Progress",
+            value=f"{total - remaining} / {total} completed",
+            inline=False
+        )
+
     async def _release_from_detention(self, guild: discord.Guild, user: discord.Member, completed: bool = False):
         """Release a user from detention and restore their roles."""
-        guild_id = str(guild.id)
-        user_id = str(user.id)
+        guild_id = guild.id
+        user_id = user.id
         
         guild_detentions = self.detention_cache.get(guild_id, {})
         user_data = guild_detentions.pop(user_id, None)
+        self._detained_index.get(guild_id, set()).discard(user_id)
+        self._locks.pop((guild_id, user_id), None)
         
         if not user_data:
             return
         
-        # Delete pinned message
-        channel_id = self.settings_cache.get(guild_id, {}).get("detention_channel_id")
-        if channel_id and user_data.get("pin_message_id"):
-            channel = guild.get_channel(channel_id)
-            if channel:
-                try:
-                    msg = await channel.fetch_message(user_data["pin_message_id"])
-                    await msg.unpin()
-                    await msg.delete()
-                except (discord.NotFound, discord.Forbidden, discord.HTTPException):
-                    pass
+        guild_settings = self._guild_settings(guild_id)
+        channel_id = guild_settings.get("detention_channel_id")
+        channel = guild.get_channel(channel_id) if channel_id else None
         
         # Restore original roles (and keep booster role if they have it)
-        booster_role_id = self.settings_cache.get(guild_id, {}).get("booster_role_id")
+        booster_role_id = guild_settings.get("booster_role_id")
         booster_role = guild.get_role(booster_role_id) if booster_role_id else None
         
-        roles = [guild.get_role(rid) for rid in user_data.get("original_roles", [])]
+        roles = [guild.get_role(rid) for rid in user_data.original_roles]
         roles = [r for r in roles if r is not None]
         
         # Add booster role back if they still have it
-        if booster_role and booster_role in user.roles:
-            if booster_role not in roles:
+        if booster_role and booster_role_id not in user_data.original_roles:
+            # Member.get_role checks the cached role-id list without building Role objects
+            if user.get_role(booster_role_id):
                 roles.append(booster_role)
         
-        try:
-            await user.edit(roles=roles, reason="Released from detention")
-            self.logger.info(f"[Detention] Restored {len(roles)} roles to {user.display_name}")
-        except discord.Forbidden:
-            self.logger.error(f"[Detention] Failed to restore roles for {user.display_name}")
-        except discord.HTTPException as e:
-            self.logger.error(f"[Detention] HTTP error restoring roles for {user.display_name}: {e}")
+        async def remove_pin():
+            if not channel or not user_data.pin_message_id:
+                return
+            try:
+                msg = channel.get_partial_message(user_data.pin_message_id)
+                await msg.unpin()
+                await msg.delete()
+            except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+                pass
+        
+        async def restore_roles():
+            try:
+                await user.edit(roles=roles, reason="Released from detention")
+                self.logger.info(f"[Detention] Restored {len(roles)} roles to {user.display_name}")
+            except discord.Forbidden:
+                self.logger.error(f"[Detention] Failed to restore roles for {user.display_name}")
+            except discord.HTTPException as e:
+                self.logger.error(f"[Detention] HTTP error restoring roles for {user.display_name}: {e}")
+        
+        # The pin cleanup and the role restore are independent requests
+        await asyncio.gather(remove_pin(), restore_roles())
         
-        # Save changes
-        await self.data_manager.save_data("detention_data", self.detention_cache)
+        # Removal is picked up by the next snapshot
+        await self._log_event({"t": "release", "g": guild_id, "u": user_id})
         
         # Send completion message
         if completed and channel:
             try:
                 await channel.send(
-                    self.personality.get("detention_done", f"{user.mention} has completed their detention!").format(user=user.mention)
+                    self.templates["detention_done"].format(user=user.mention)
                 )
             except (discord.Forbidden, discord.HTTPException):
                 pass
 
     async def _update_pinned_message(self, guild: discord.Guild, user: discord.Member):
         """Update the pinned progress message for a detained user."""
-        guild_id = str(guild.id)
-        user_id = str(user.id)
+        guild_id = guild.id
+        user_id = user.id
         
         data = self.detention_cache.get(guild_id, {}).get(user_id)
-        if not data or not data.get("pin_message_id"):
+        if not data or not data.pin_message_id:
             return
         
-        channel_id = self.settings_cache.get(guild_id, {}).get("detention_channel_id")
+        channel_id = self._guild_settings(guild_id).get("detention_channel_id")
         if not channel_id:
             return
         
@@ -529,14 +764,18 @@ class Detention(commands.Cog):
             return
         
         try:
-            msg = await channel.fetch_message(data["pin_message_id"])
-            embed = self._create_embed(
-                user,
-                data["sentence"],
-                data["reps_remaining"],
-                data["total_reps"]
-            )
-            await msg.edit(embed=embed)
+            msg = channel.get_partial_message(data.pin_message_id)
+            if data.embed is None:
+                # Detentions restored from disk have no embed built yet
+                data.embed = self._create_embed(
+                    user,
+                    data.sentence,
+                    data.reps_remaining,
+                    data.total_reps
+                )
+            else:
+                self._set_embed_progress(data.embed, data.reps_remaining, data.total_reps)
+            await msg.edit(embed=data.embed)
         except (discord.NotFound, discord.Forbidden, discord.HTTPException):
             pass
 
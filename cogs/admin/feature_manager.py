@@ -3,12 +3,14 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
+from types import MappingProxyType
 from typing import Dict, Optional
 
 from config.personalities import PERSONALITY_RESPONSES
 from cogs.admin.bot_admin import is_bot_admin
 
-AVAILABLE_FEATURES = [
+# Display order for the command choices; AVAILABLE_FEATURES is the lookup set
+_FEATURE_ORDER = (
     # Admin
     "clear_commands",       # /clear and /clearsearch
     "detention_system",
@@ -25,28 +27,37 @@ AVAILABLE_FEATURES = [
     "custom_roles",
     "reminders",
     "web_search"
-]
+)
+AVAILABLE_FEATURES = frozenset(_FEATURE_ORDER)
+# Built once at import instead of re-running replace()/title() per use
+_FEATURE_TITLES: Dict[str, str] = {name: name.replace('_', ' ').title() for name in _FEATURE_ORDER}
+_FEATURE_CHOICES = [app_commands.Choice(name=title, value=name) for name, title in _FEATURE_TITLES.items()]
+_STATE_CHOICES = [app_commands.Choice(name="On", value="on"), app_commands.Choice(name="Off", value="off")]
 
 class FeatureManager(commands.Cog):
+    # Shared read-only fallback for guilds without overrides; avoids a new dict per check
+    _EMPTY = MappingProxyType({})
+
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger(__name__)
         self.data_manager = self.bot.data_manager
-        # In-memory cache for feature toggles for instant checks
-        self.feature_settings_cache: Dict[str, Dict[str, bool]] = {}
+        # In-memory cache for feature toggles for instant checks, keyed by integer guild id
+        self.feature_settings_cache: Dict[int, Dict[str, bool]] = {}
 
     @commands.Cog.listener()
     async def on_ready(self):
         """Loads feature toggle settings into memory."""
         self.logger.info("Loading feature toggle settings into memory...")
-        self.feature_settings_cache = await self.data_manager.get_data("feature_toggles")
+        raw_settings = await self.data_manager.get_data("feature_toggles")
+        # JSON object keys are strings; convert once so lookups need no str() per call
+        self.feature_settings_cache = {int(guild_id): toggles for guild_id, toggles in raw_settings.items()}
         self.logger.info("Feature toggle settings cache is ready.")
 
     def is_feature_enabled(self, guild_id: int, feature_name: str) -> bool:
         """A quick, synchronous check to see if a feature is enabled for a guild."""
-        guild_settings = self.feature_settings_cache.get(str(guild_id), {})
         # Features are enabled by default if no setting is found.
-        return guild_settings.get(feature_name, True)
+        return self.feature_settings_cache.get(guild_id, self._EMPTY).get(feature_name, True)
 
     @app_commands.command(name="feature-manager", description="[Admin] Enable or disable bot features for this server.")
     @app_commands.default_permissions(administrator=True)
@@ -56,14 +67,13 @@ class FeatureManager(commands.Cog):
         state="The new state for the feature."
     )
     @app_commands.choices(
-        feature=[app_commands.Choice(name=name.replace('_', ' ').title(), value=name) for name in AVAILABLE_FEATURES],
-        state=[app_commands.Choice(name="On", value="on"), app_commands.Choice(name="Off", value="off")]
+        feature=_FEATURE_CHOICES,
+        state=_STATE_CHOICES
     )
     async def feature_manager(self, interaction: discord.Interaction, feature: str, state: str):
         await interaction.response.defer() # Public response for admin transparency
         
-        guild_id = str(interaction.guild_id)
-        guild_settings = self.feature_settings_cache.setdefault(guild_id, {})
+        guild_settings = self.feature_settings_cache.setdefault(interaction.guild_id, {})
         
         new_state_bool = (state == "on")
         guild_settings[feature] = new_state_bool
@@ -71,7 +81,7 @@ class FeatureManager(commands.Cog):
         await self.data_manager.save_data("feature_toggles", self.feature_settings_cache)
         
         state_text = "ENABLED" if new_state_bool else "DISABLED"
-        await interaction.followup.send(f"Fine. The **{feature.replace('_', ' ').title()}** feature is now **{state_text}** for this server.")
+        await interaction.followup.send(f"Fine. The **{_FEATURE_TITLES[feature]}** feature is now **{state_text}** for this server.")
 
 async def setup(bot):
     await bot.add_cog(FeatureManager(bot))
\ No newline at end of file
@@ -3,11 +3,21 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
+import asyncio
+import time
 from datetime import datetime, timezone
 
 from cogs.admin.bot_admin import is_bot_admin
 
 class PerformanceMonitor(commands.Cog):
+    # Embed colors by memory usage (<250 MB, <500 MB, above), created once instead of per command
+    _COLORS = (discord.Color.green(), discord.Color.yellow(), discord.Color.red())
+    _FIELD_NAMES = (
+        "🧠 RAM Usage", "💻 CPU Usage", "🧵 Threads",
+        "⚡ Gateway Latency", "🔁 API Roundtrip", "🌀 Event Loop Lag",
+        "🏠 Guilds", "⏳ Uptime",
+    )
+
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger(__name__)
@@ -17,7 +27,16 @@ class PerformanceMonitor(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     @is_bot_admin()
     async def performance(self, interaction: discord.Interaction):
+        # Time the defer to get a real REST roundtrip, not just the gateway heartbeat
+        started = time.perf_counter()
         await interaction.response.defer(ephemeral=True)
+        roundtrip_ms = (time.perf_counter() - started) * 1000
+        
+        # How long a ready callback waits for its turn: high values mean the loop is congested
+        loop = asyncio.get_running_loop()
+        yielded_at = loop.time()
+        await asyncio.sleep(0)
+        loop_lag_ms = (loop.time() - yielded_at) * 1000
         
         # --- OPTIMIZATION: Gather a richer set of metrics ---
         memory_mb = self.resource_monitor.get_memory_usage_mb()
@@ -30,9 +49,7 @@ class PerformanceMonitor(commands.Cog):
         uptime_str = f"{discord.utils.format_dt(self.bot.start_time, style='R')}" if self.bot.start_time else "Calculating..."
 
         # Determine embed color based on memory usage
-        if memory_mb < 250: color = discord.Color.green()
-        elif memory_mb < 500: color = discord.Color.yellow()
-        else: color = discord.Color.red()
+        color = self._COLORS[(memory_mb >= 250) + (memory_mb >= 500)]
 
         embed = discord.Embed(
             title="Tika Performance Report",
@@ -42,12 +59,19 @@ class PerformanceMonitor(commands.Cog):
         )
         
         # --- OPTIMIZATION: Display more comprehensive data ---
-        embed.add_field(name="🧠 RAM Usage", value=f"**{memory_mb:.2f} MB**", inline=True)
-        embed.add_field(name="💻 CPU Usage", value=f"**{cpu_percent:.1f}%**", inline=True)
-        embed.add_field(name="🧵 Threads", value=f"**{thread_count}**", inline=True)
-        embed.add_field(name="⚡ Gateway Latency", value=f"**{latency_ms:.0f} ms**", inline=True)
-        embed.add_field(name="🏠 Guilds", value=f"**{guild_count}**", inline=True)
-        embed.add_field(name="⏳ Uptime", value=uptime_str, inline=True)
+        values = (
+            f"**{memory_mb:.2f} MB**",
+            f"**{cpu_percent:.1f}%**",
+            f"**{thread_count}**",
+            f"**{latency_ms:.0f} ms**",
+            f"**{roundtrip_ms:.0f} ms**",
+            f"**{loop_lag_ms:.1f} ms**",
+            f"**{guild_count}**",
+            uptime_str,
+        )
+        add_field = embed.add_field
+        for name, value in zip(self._FIELD_NAMES, values):
+            add_field(name=name, value=value, inline=True)
         
         embed.set_footer(text=f"Shard ID: {interaction.guild.shard_id if interaction.guild else 'N/A'}")
         
@@ -97,6 +97,13 @@ class GifSourceView(discord.ui.View):
 # --- The Main Cog ---
 
 class FunCommands(commands.Cog):
+    # Static game tables, built once instead of on every command
+    COIN_FACES = ("Heads", "Tails")
+    RPS_CHOICES = ("rock", "paper", "scissors")
+    RPS_WINS = frozenset({("rock", "scissors"), ("scissors", "paper"), ("paper", "rock")})
+    RPS_EMOJIS = {"rock": "🗿", "paper": "📄", "scissors": "✂️"}
+    URL_CHECK_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger(__name__)
@@ -207,9 +214,9 @@ class FunCommands(commands.Cog):
             return False
         
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                async with session.head(url) as response:
-                    return response.status == 200 and response.content_type.startswith(('image/', 'video/'))
+            # Reuse the bot's pooled session so repeat checks skip the TCP/TLS handshake
+            async with self.bot.http_session.head(url, timeout=self.URL_CHECK_TIMEOUT) as response:
+                return response.status == 200 and response.content_type.startswith(('image/', 'video/'))
         except Exception:
             return False
 
@@ -256,20 +263,21 @@ class FunCommands(commands.Cog):
             self.logger.error(f"Error getting embed URL for {command}: {e}")
             return random.choice(self.default_embeds.get(command, [""]))
 
+    @staticmethod
+    def _result_embed(title: str, description: str, color: discord.Color, image_url: Optional[str] = None) -> discord.Embed:
+        """Builds the standard result embed shared by the game commands."""
+        embed = discord.Embed(title=title, description=description, color=color)
+        if image_url:
+            embed.set_image(url=image_url)
+        return embed
+
     @app_commands.command(name="coinflip", description="Flip a coin and see if you get heads or tails!")
     async def coinflip(self, interaction: discord.Interaction):
         if not await self._is_feature_enabled(interaction):
             return
         
         flipping_url = self._get_random_embed_url(interaction, "coinflip")
-        embed = discord.Embed(
-            title="🪙 Flipping coin...", 
-            color=discord.Color.gold(),
-            description="*The coin spins through the air...*"
-        )
-        if flipping_url:
-            embed.set_image(url=flipping_url)
-        
+        embed = self._result_embed("🪙 Flipping coin...", "*The coin spins through the air...*", discord.Color.gold(), flipping_url)
         await interaction.response.send_message(embed=embed)
         await asyncio.sleep(random.uniform(2, 4))  # Variable delay for suspense
         
@@ -277,19 +285,17 @@ class FunCommands(commands.Cog):
         frustration = get_frustration_level(self.bot, interaction)
         response_index = min(frustration, len(self.personality["coinflip_responses"]) - 1)
         
-        result = random.choice(["Heads", "Tails"])
+        result = random.choice(self.COIN_FACES)
         response_template = self.personality["coinflip_responses"][response_index]
         color = discord.Color.green() if result == "Heads" else discord.Color.red()
         emoji = "👑" if result == "Heads" else "🔹"
         
-        result_embed = discord.Embed(
-            title=f"{emoji} Coin Flip Result: {result}!",
-            description=response_template.format(result=result),
-            color=color
+        result_embed = self._result_embed(
+            f"{emoji} Coin Flip Result: {result}!",
+            response_template.format(result=result),
+            color,
+            flipping_url
         )
-        if flipping_url:
-            result_embed.set_image(url=flipping_url)
-        
         await interaction.edit_original_response(embed=result_embed)
 
     @app_commands.command(name="roll", description="Roll dice in XdY format (e.g., 1d6, 2d20, 3d6+5).")
@@ -320,7 +326,8 @@ class FunCommands(commands.Cog):
             return await interaction.response.send_message("❌ Modifier must be between -1000 and +1000.", ephemeral=True)
 
         # Roll the dice
-        rolls = [random.randint(1, num_sides) for _ in range(num_dice)]
+        # One C-level sampling call instead of a randint() per die
+        rolls = random.choices(range(1, num_sides + 1), k=num_dice)
         base_total = sum(rolls)
         final_total = base_total + modifier
         
@@ -343,15 +350,7 @@ class FunCommands(commands.Cog):
             else:
                 description = ""
         
-        embed = discord.Embed(
-            title=title,
-            description=description,
-            color=discord.Color.blue()
-        )
-        
-        if embed_url:
-            embed.set_image(url=embed_url)
-        
+        embed = self._result_embed(title, description, discord.Color.blue(), embed_url)
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="rps", description="Play Rock, Paper, Scissors against the bot!")
@@ -365,14 +364,14 @@ class FunCommands(commands.Cog):
         if not await self._is_feature_enabled(interaction):
             return
         user_choice = choice.value
-        bot_choice = random.choice(["rock", "paper", "scissors"])
+        bot_choice = random.choice(self.RPS_CHOICES)
         
         # Determine result
         if user_choice == bot_choice:
             result_text = self.personality["rps_tie"].format(user_choice=user_choice.title())
             color = discord.Color.light_gray()
             emoji = "🤝"
-        elif (user_choice, bot_choice) in [("rock", "scissors"), ("scissors", "paper"), ("paper", "rock")]:
+        elif (user_choice, bot_choice) in self.RPS_WINS:
             result_text = self.personality["rps_win"].format(
                 user_choice=user_choice.title(), 
                 bot_choice=bot_choice.title()
@@ -387,24 +386,21 @@ class FunCommands(commands.Cog):
             color = discord.Color.red()
             emoji = "😏"
 
-        embed = discord.Embed(
-            title=f"{emoji} Rock, Paper, Scissors Result!",
-            description=result_text,
-            color=color
+        embed = self._result_embed(
+            f"{emoji} Rock, Paper, Scissors Result!",
+            result_text,
+            color,
+            self._get_random_embed_url(interaction, "rps")
         )
         
         # Add choice visualization
-        choice_emojis = {"rock": "🗿", "paper": "📄", "scissors": "✂️"}
+        choice_emojis = self.RPS_EMOJIS
         embed.add_field(
             name="Choices",
             value=f"You: {choice_emojis[user_choice]} {user_choice.title()}\nBot: {choice_emojis[bot_choice]} {bot_choice.title()}",
             inline=False
         )
         
-        embed_url = self._get_random_embed_url(interaction, "rps")
-        if embed_url:
-            embed.set_image(url=embed_url)
-        
         await interaction.response.send_message(embed=embed)
 
     # --- Admin & Settings Commands ---
@@ -5,6 +5,7 @@ from discord import app_commands, ButtonStyle
 from discord.ui import View, Button, Modal, TextInput
 import logging
 import random
+import asyncio
 from typing import Dict, List, Literal, Optional
 
 from config.personalities import PERSONALITY_RESPONSES
@@ -318,12 +319,47 @@ class Connect4View(View):
         await self.game_cog._cleanup_game(self.players[0].guild.id, self.players)
 
 class ServerGames(commands.Cog):
+    SAVE_INTERVAL = 5  # Coalesce game start/end bookkeeping into one write
+
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger(__name__)
         self.personality = PERSONALITY_RESPONSES["server_games"]
         self.data_manager = self.bot.data_manager
         self.active_games_cache: Dict[str, Dict[str, str]] = {}
+        self._is_dirty = asyncio.Event()
+        self._save_lock = asyncio.Lock()
+        self.save_task: Optional[asyncio.Task] = None
+
+    async def cog_load(self):
+        self.save_task = self.bot.loop.create_task(self._periodic_save())
+
+    async def cog_unload(self):
+        if self.save_task:
+            self.save_task.cancel()
+            try: await self.save_task
+            except asyncio.CancelledError: pass
+        if self._is_dirty.is_set():
+            self.logger.info("Performing final save for active server games...")
+            await self._save_games()
+
+    async def _periodic_save(self):
+        """Background task that writes the active game registry at most once per SAVE_INTERVAL."""
+        while not self.bot.is_closed():
+            try:
+                await self._is_dirty.wait()
+                await asyncio.sleep(self.SAVE_INTERVAL)
+                await self._save_games()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error in ServerGames periodic save: {e}", exc_info=True)
+                await asyncio.sleep(self.SAVE_INTERVAL * 2)
+
+    async def _save_games(self):
+        async with self._save_lock:
+            self._is_dirty.clear()
+            await self.data_manager.save_data("active_server_games", self.active_games_cache)
 
     async def _is_feature_enabled(self, interaction: discord.Interaction) -> bool:
         """A local check to see if the server_games feature is enabled."""
@@ -350,7 +386,7 @@ class ServerGames(commands.Cog):
         
         cleaned = any(guild_games.pop(str(player.id), None) for player in players)
         if cleaned:
-            await self.data_manager.save_data("active_server_games", self.active_games_cache)
+            self._is_dirty.set()
 
     async def _check_and_clear_stuck_players(self, guild_id: int, *player_ids: int) -> bool:
         """Check if players are stuck in games and clear them if so. Returns True if any were cleared."""
@@ -366,7 +402,7 @@ class ServerGames(commands.Cog):
                 cleared_any = True
         
         if cleared_any:
-            await self.data_manager.save_data("active_server_games", self.active_games_cache)
+            self._is_dirty.set()
             
         return cleared_any
 
@@ -397,7 +433,7 @@ class ServerGames(commands.Cog):
             guild_games = self.active_games_cache.setdefault(str(interaction.guild_id), {})
             guild_games[str(challenger.id)] = game_type
             guild_games[str(opponent.id)] = game_type
-            await self.data_manager.save_data("active_server_games", self.active_games_cache)
+            self._is_dirty.set()
             
             if game_type == "tictactoe":
                 game_view = TicTacToeView(self, challenger, opponent)
@@ -448,7 +484,7 @@ class ServerGames(commands.Cog):
         
         guild_games = self.active_games_cache.setdefault(str(interaction.guild_id), {})
         guild_games[str(player.id)] = "hangman"
-        await self.data_manager.save_data("active_server_games", self.active_games_cache)
+        self._is_dirty.set()
         
         word = random.choice(HANGMAN_WORDS)
         view = HangmanView(self, player, word)
@@ -482,7 +518,7 @@ class ServerGames(commands.Cog):
             if not user: 
                 return await interaction.followup.send("You must specify a user to clear.")
             if guild_games.pop(str(user.id), None):
-                await self.data_manager.save_data("active_server_games", self.active_games_cache)
+                await self._save_games()
                 await interaction.followup.send(f"Cleared the game state for **{user.display_name}**.")
             else:
                 await interaction.followup.send(f"**{user.display_name}** is not in an active game.")
@@ -491,7 +527,7 @@ class ServerGames(commands.Cog):
                 return await interaction.followup.send("There were no active games to clear.")
             count = len(guild_games)
             self.active_games_cache.pop(guild_id_str, None)
-            await self.data_manager.save_data("active_server_games", self.active_games_cache)
+            await self._save_games()
             await interaction.followup.send(f"Cleared **{count}** active game(s) for this server.")
 
 async def setup(bot):
@@ -8,6 +8,7 @@ import time
 import asyncio
 import aiofiles 
 import re # Import the regular expression module
+import heapq
 from collections import defaultdict
 from typing import Dict, Optional, Set, List
 
@@ -132,6 +133,8 @@ class ConfirmResetView(discord.ui.View):
         self.stop()
 
 class WordGame(commands.Cog):
+    SAVE_INTERVAL = 5  # Coalesce game saves so a busy chain doesn't rewrite both files per word
+
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger(__name__)
@@ -142,15 +145,16 @@ class WordGame(commands.Cog):
         self.game_state_cache: Dict[str, Dict] = {}
         self.word_list: Set[str] = set()
         self._guild_locks = defaultdict(asyncio.Lock)
+        self._is_dirty = asyncio.Event()
+        self._save_lock = asyncio.Lock()
+        self.save_task: Optional[asyncio.Task] = None
         self.stale_game_task.start()
 
     async def _is_user_bot_admin(self, interaction: discord.Interaction) -> bool:
         if interaction.user.guild_permissions.administrator: return True
         cog = self.bot.get_cog('BotAdmin')
         if not cog: return False
-        bot_admins_data = await cog.data_manager.get_data("bot_admins")
-        guild_admins = bot_admins_data.get(str(interaction.guild.id), [])
-        return interaction.user.id in guild_admins
+        return interaction.user.id in cog.admin_cache.get(interaction.guild.id, ())
 
     # ... (cog_load and other methods remain the same) ...
     async def cog_load(self):
@@ -167,31 +171,59 @@ class WordGame(commands.Cog):
         for guild_id, state in game_state_data.items():
             if "used_words" in state and isinstance(state["used_words"], list): state["used_words"] = set(state["used_words"])
         self.game_state_cache = game_state_data; self.logger.info("WordGame data cache is ready.")
+        self.save_task = self.bot.loop.create_task(self._periodic_save())
+
+    async def cog_unload(self):
+        self.stale_game_task.cancel()
+        if self.save_task:
+            self.save_task.cancel()
+            try: await self.save_task
+            except asyncio.CancelledError: pass
+        if self._is_dirty.is_set():
+            self.logger.info("Performing final save for WordGame data...")
+            await self._save_game_state()
+
+    def _mark_dirty(self): self._is_dirty.set()
 
-    def cog_unload(self): self.stale_game_task.cancel()
+    async def _periodic_save(self):
+        """Background task that writes scores and game state at most once per SAVE_INTERVAL."""
+        while not self.bot.is_closed():
+            try:
+                await self._is_dirty.wait()
+                await asyncio.sleep(self.SAVE_INTERVAL)
+                await self._save_game_state()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error in WordGame periodic save: {e}", exc_info=True)
+                await asyncio.sleep(self.SAVE_INTERVAL * 2)
 
     @tasks.loop(minutes=5)
     async def stale_game_task(self):
-        now = time.time()
-        for guild_id_str, state in list(self.game_state_cache.items()):
-            if now - state.get("timestamp", 0) > 43200:
-                channel_id = self.settings_cache.get(guild_id_str, {}).get("word_game_channel_id")
-                if channel_id and (channel := self.bot.get_channel(int(channel_id))):
-                    self.logger.info(f"Stale WordGame round in guild {guild_id_str}. Resetting.")
-                    await channel.send("This round has been idle for a while... Let's start fresh!")
-                    await self._send_new_letter_challenge(channel, is_start=True)
+        if not self.game_state_cache: return
+        # Collect only the stale rounds up front; most ticks find none and return without copying the cache
+        cutoff = time.time() - 43200
+        stale = [gid for gid, state in self.game_state_cache.items() if state.get("timestamp", 0) < cutoff]
+        for guild_id_str in stale:
+            channel_id = self.settings_cache.get(guild_id_str, {}).get("word_game_channel_id")
+            if channel_id and (channel := self.bot.get_channel(int(channel_id))):
+                self.logger.info(f"Stale WordGame round in guild {guild_id_str}. Resetting.")
+                await channel.send("This round has been idle for a while... Let's start fresh!")
+                await self._send_new_letter_challenge(channel, is_start=True)
     
     @stale_game_task.before_loop
     async def before_stale_game_task(self): await self.bot.wait_until_ready()
 
     async def _save_game_state(self):
-        state_to_save = {}
-        for guild_id, state in self.game_state_cache.items():
-            state_copy = state.copy()
-            if "used_words" in state_copy: state_copy["used_words"] = list(state_copy["used_words"])
-            state_to_save[guild_id] = state_copy
-        await self.data_manager.save_data("word_game_scores", self.scores_cache)
-        await self.data_manager.save_data("word_game_state", state_to_save)
+        async with self._save_lock:
+            self._is_dirty.clear()
+            state_to_save = {}
+            for guild_id, state in self.game_state_cache.items():
+                state_copy = state.copy()
+                if "used_words" in state_copy: state_copy["used_words"] = list(state_copy["used_words"])
+                state_to_save[guild_id] = state_copy
+            await self.data_manager.save_data("word_game_scores", self.scores_cache)
+            await self.data_manager.save_data("word_game_state", state_to_save)
 
     async def check_word_game_message(self, message: discord.Message) -> bool:
         if not message.guild or message.author.bot: return False
@@ -212,7 +244,7 @@ class WordGame(commands.Cog):
         time_taken = time.time() - state["timestamp"]; xp_gained = self._calculate_xp(time_taken)
         guild_scores = self.scores_cache.setdefault(guild_id, {}); guild_scores[user_id] = guild_scores.get(user_id, 0) + xp_gained
         state["last_letter"] = word[-1]; state.setdefault("used_words", set()).add(word); state["timestamp"] = time.time()
-        await self._save_game_state()
+        self._mark_dirty()
         correct_embed = discord.Embed(title="✅ Correct!", description=f"**`{word.capitalize()}`** by {message.author.mention}", color=discord.Color.green())
         correct_embed.add_field(name="XP Gained", value=f"+{xp_gained}"); correct_embed.add_field(name="Total XP", value=f"{guild_scores[user_id]:,}")
         challenge_embed = discord.Embed(title="Next Word Challenge!", description=f"The next word must start with **{state['last_letter'].upper()}**!", color=0x00aaff)
@@ -238,16 +270,18 @@ class WordGame(commands.Cog):
         if user:
             xp = guild_scores.get(str(target_user.id))
             if xp is None: return await interaction.followup.send(f"{target_user.display_name} hasn't played yet.")
-            sorted_users = sorted(guild_scores.items(), key=lambda x: x[1], reverse=True)
-            try: rank = [i for i, (uid, _) in enumerate(sorted_users, 1) if uid == str(target_user.id)][0]
-            except IndexError: rank = "N/A"
+            # One pass instead of a full sort: count who places ahead (ties keep insertion order, as the stable sort did)
+            target_id, rank, seen_self = str(target_user.id), 1, False
+            for uid, score in guild_scores.items():
+                if uid == target_id: seen_self = True
+                elif score > xp or (score == xp and not seen_self): rank += 1
             embed = discord.Embed(title=f"📊 Stats for {target_user.display_name}", color=discord.Color.green())
             embed.set_thumbnail(url=target_user.display_avatar.url); embed.add_field(name="Total XP", value=f"{xp:,}"); embed.add_field(name="Rank", value=f"#{rank}")
             await interaction.followup.send(embed=embed)
         else:
-            sorted_users = sorted(guild_scores.items(), key=lambda x: x[1], reverse=True)
+            top_users = heapq.nlargest(10, guild_scores.items(), key=lambda x: x[1])
             embed = discord.Embed(title="🏆 Word Game Leaderboard", color=0xffd700)
-            description = [f"**{rank}.** {interaction.guild.get_member(int(user_id)).display_name if interaction.guild.get_member(int(user_id)) else f'User ({user_id})'} - **{xp:,}** XP" for rank, (user_id, xp) in enumerate(sorted_users[:10], 1)]
+            description = [f"**{rank}.** {member.display_name if (member := interaction.guild.get_member(int(user_id))) else f'User ({user_id})'} - **{xp:,}** XP" for rank, (user_id, xp) in enumerate(top_users, 1)]
             embed.description = "\n".join(description)
             await interaction.followup.send(embed=embed)
 
@@ -256,7 +290,7 @@ class WordGame(commands.Cog):
     async def _send_new_letter_challenge(self, channel: discord.TextChannel, is_start: bool = False):
         guild_id = str(channel.guild.id); letter = random.choice("abcdefghijklmnopqrstuvwxyz")
         self.game_state_cache[guild_id] = {"last_letter": letter, "timestamp": time.time(), "used_words": set()}
-        await self._save_game_state()
+        self._mark_dirty()
         embed = discord.Embed(title="🚀 New Word Chain Game Started!", description=f"The first word must start with **{letter.upper()}**!", color=0x5865F2)
         if not is_start: embed.title = "New Round!"
         await channel.send(embed=embed)
@@ -3,11 +3,13 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
+import asyncio
 import re
 import time
 import random
-from typing import Optional, Dict, List, Tuple
-from collections import defaultdict, deque
+import heapq
+from typing import Optional, Dict, List, Set, Tuple
+from collections import defaultdict, deque, OrderedDict
 
 from config.personalities import PERSONALITY_RESPONSES
 from cogs.admin.bot_admin import is_bot_admin
@@ -25,22 +27,45 @@ class AutoReply(commands.Cog):
         self.USER_COOLDOWN = 2.0     # Per-user cooldown to prevent spam
         self.TRIGGER_COOLDOWN = 3.0  # Per-trigger cooldown
         
-        # Cooldown tracking
+        # Cooldown tracking (time.monotonic() timestamps; never persisted).
+        # Kept in last-use order so lapsed entries can be dropped from the front.
         self.last_global_reply = 0
-        self.channel_cooldowns = {}
-        self.user_cooldowns = defaultdict(float)
-        self.trigger_cooldowns = defaultdict(float)
+        self.channel_cooldowns: Dict[int, float] = {}
+        self.user_cooldowns: Dict[int, float] = {}
+        self.trigger_cooldowns: Dict[str, float] = {}
         
         # --- SMART CACHING ---
         self.all_replies_cache = {}
         self.regex_cache = {}
+        # Guilds whose triggers changed since their pattern was last compiled
+        self._regex_dirty: Set[str] = set()
+        # Int IDs of guilds with any triggers, checked before any per-message work
+        self._active_guild_ids: Set[int] = set()
+        # guild_id -> {lowercased trigger or alt: main trigger}, rebuilt alongside regex_cache
+        self.trigger_lookup: Dict[str, Dict[str, str]] = {}
         # Fixed: Ensure trigger_stats always returns a proper dict
         self.trigger_stats = defaultdict(lambda: {"count": 0, "last_used": 0})
         
         # --- ANTI-SPAM FEATURES ---
-        self.recent_messages = defaultdict(lambda: deque(maxlen=10))  # Track recent messages per user
+        # Recent messages per user, kept as an LRU so only active users stay in memory
+        self.recent_messages: OrderedDict[int, deque] = OrderedDict()
+        self.MAX_TRACKED_USERS = 1000  # Least recently active users are dropped beyond this
+        self.RECENT_MESSAGES_PER_USER = 10
         self.MAX_IDENTICAL_MESSAGES = 3  # Max identical messages before ignoring user
         
+        # --- BATCHED SAVES ---
+        # Trigger edits and usage stats only mark themselves dirty; the
+        # background task writes whichever changed once per interval.
+        # Triggers are stored one shard per guild, so an edit only rewrites that guild.
+        self.SAVE_INTERVAL = 10
+        self._is_dirty = asyncio.Event()
+        self._dirty_guilds: Set[str] = set()
+        self._stats_dirty = False
+        self._save_lock = asyncio.Lock()
+        self.save_task: Optional[asyncio.Task] = None
+        # In-flight reply sends, referenced so they aren't garbage-collected mid-request
+        self._pending_replies: Set[asyncio.Task] = set()
+        
         # --- PERFORMANCE METRICS ---
         self.performance_stats = {
             "total_checks": 0,
@@ -61,10 +86,15 @@ class AutoReply(commands.Cog):
             return False
         return True
 
-    @commands.Cog.listener()
-    async def on_ready(self):
+    async def cog_load(self):
+        """Load triggers and stats into memory, then start the background save task."""
         self.logger.info("Loading optimized auto-replies system...")
-        self.all_replies_cache = await self.data_manager.get_data("auto_replies")
+        self.all_replies_cache = await self.data_manager.get_shards("auto_replies")
+        migrated = False
+        if not self.all_replies_cache:
+            # Older installs kept every guild's triggers in a single auto_replies.json
+            self.all_replies_cache = await self.data_manager.get_data("auto_replies")
+            migrated = bool(self.all_replies_cache)
         
         # Load enhanced trigger data with better error handling
         try:
@@ -87,56 +117,142 @@ class AutoReply(commands.Cog):
         # Build regex cache for all guilds
         for guild_id, triggers in self.all_replies_cache.items():
             self._update_regex_for_guild(guild_id, triggers)
+        self._active_guild_ids = {int(guild_id) for guild_id, triggers in self.all_replies_cache.items() if triggers}
+        
+        if migrated:
+            self._dirty_guilds.update(self.all_replies_cache)
+            async with self._save_lock:
+                await self._save_dirty()
+            # Empty the legacy file so it is never loaded over the shards again
+            await self.data_manager.save_data("auto_replies", {})
+            self.logger.info(f"Migrated auto-replies for {len(self.all_replies_cache)} guild(s) to per-guild shards.")
             
         self.logger.info(f"Auto-Reply system ready with {len(self.all_replies_cache)} guild configs")
+        self.save_task = self.bot.loop.create_task(self._periodic_save())
+
+    async def cog_unload(self):
+        """Stop the save task and write out any pending changes."""
+        if self.save_task:
+            self.save_task.cancel()
+            try:
+                await self.save_task
+            except asyncio.CancelledError:
+                pass
+        
+        if self._is_dirty.is_set():
+            self.logger.info("Performing final save for auto-reply data...")
+            async with self._save_lock:
+                await self._save_dirty()
+
+    def _mark_dirty(self, guild_id: Optional[str] = None, stats: bool = False):
+        """Queue a guild's triggers and/or the usage stats for the next background save."""
+        if guild_id is not None:
+            self._dirty_guilds.add(guild_id)
+        self._stats_dirty |= stats
+        self._is_dirty.set()
+
+    async def _save_dirty(self):
+        """Write whichever datasets changed since the last save. Caller must hold the save lock."""
+        self._is_dirty.clear()
+        dirty, self._dirty_guilds = self._dirty_guilds, set()
+        for guild_id in dirty:
+            if guild_triggers := self.all_replies_cache.get(guild_id):
+                await self.data_manager.save_shard("auto_replies", guild_id, guild_triggers)
+            else:
+                await self.data_manager.delete_shard("auto_replies", guild_id)
+        if self._stats_dirty:
+            self._stats_dirty = False
+            # Convert defaultdict to regular dict for saving
+            await self.data_manager.save_data("auto_reply_stats", dict(self.trigger_stats))
+
+    async def _periodic_save(self):
+        """Background task that coalesces bursts of changes into one write."""
+        while not self.bot.is_closed():
+            try:
+                await self._is_dirty.wait()
+                await asyncio.sleep(self.SAVE_INTERVAL)
+                
+                async with self._save_lock:
+                    await self._save_dirty()
+                    self.logger.debug("Saved auto-reply data")
+                    
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error in auto-reply periodic save: {e}", exc_info=True)
+                await asyncio.sleep(self.SAVE_INTERVAL * 2)
+
+    def _get_user_history(self, user_id: int) -> deque:
+        """Get a user's recent message history, marking them as recently active."""
+        user_history = self.recent_messages.get(user_id)
+        if user_history is None:
+            user_history = self.recent_messages[user_id] = deque(maxlen=self.RECENT_MESSAGES_PER_USER)
+            if len(self.recent_messages) > self.MAX_TRACKED_USERS:
+                self.recent_messages.popitem(last=False)
+        else:
+            self.recent_messages.move_to_end(user_id)
+        return user_history
 
     def _is_spam_message(self, user_id: int, content: str) -> bool:
         """Check if user is sending spam messages."""
-        user_history = self.recent_messages[user_id]
+        user_history = self._get_user_history(user_id)
         
         # Count identical messages
-        identical_count = sum(1 for msg in user_history if msg == content)
-        
-        if identical_count >= self.MAX_IDENTICAL_MESSAGES:
+        if user_history.count(content) >= self.MAX_IDENTICAL_MESSAGES:
             return True
             
         # Add current message to history
         user_history.append(content)
         return False
 
+    def _triggers_changed(self, guild_id: str):
+        """Refresh the active-guild gate and queue a lazy recompile after a trigger edit."""
+        if self.all_replies_cache.get(guild_id):
+            self._active_guild_ids.add(int(guild_id))
+        else:
+            self._active_guild_ids.discard(int(guild_id))
+        self._regex_dirty.add(guild_id)  # Recompiled lazily on the next message
+
+    def _get_guild_regex(self, guild_id: str) -> Optional[re.Pattern]:
+        """Return the guild's pattern, recompiling it first if its triggers were edited."""
+        if guild_id in self._regex_dirty:
+            self._regex_dirty.discard(guild_id)
+            self._update_regex_for_guild(guild_id, self.all_replies_cache.get(guild_id, {}))
+        return self.regex_cache.get(guild_id)
+
     def _update_regex_for_guild(self, guild_id: str, guild_triggers: dict):
         """Build optimized regex pattern for guild with word boundaries and case insensitivity."""
         if not guild_triggers:
             self.regex_cache[guild_id] = None
+            self.trigger_lookup.pop(guild_id, None)
             return
             
-        all_patterns = []
+        lookup = {}
         
         for trigger, data in guild_triggers.items():
-            # Escape the main trigger and add word boundaries
-            escaped_trigger = re.escape(trigger)
-            all_patterns.append(f"\\b{escaped_trigger}\\b")
-            
-            # Add alternatives with word boundaries
+            lookup[trigger.lower()] = trigger  # Main triggers win over another trigger's alt
             for alt in data.get("alts", []):
-                escaped_alt = re.escape(alt)
-                all_patterns.append(f"\\b{escaped_alt}\\b")
+                lookup.setdefault(alt.lower(), trigger)
+        
+        self.trigger_lookup[guild_id] = lookup
         
-        if all_patterns:
-            # Create optimized pattern with non-capturing groups
-            pattern = "(?:" + "|".join(all_patterns) + ")"
+        if lookup:
+            # One shared pair of word boundaries around a non-capturing alternation.
+            # Longest words go first so "cat food" isn't shadowed by "cat" at the same position.
+            words = sorted(lookup, key=len, reverse=True)
+            pattern = r"\b(?:" + "|".join(map(re.escape, words)) + r")\b"
             try:
                 self.regex_cache[guild_id] = re.compile(pattern, re.IGNORECASE)
-                self.logger.debug(f"Built regex for guild {guild_id} with {len(all_patterns)} patterns")
+                self.logger.debug(f"Built regex for guild {guild_id} with {len(words)} patterns")
             except re.error as e:
                 self.logger.error(f"Regex compilation failed for guild {guild_id}: {e}")
                 self.regex_cache[guild_id] = None
         else:
             self.regex_cache[guild_id] = None
 
-    def _check_all_cooldowns(self, channel_id: int, user_id: int, trigger_key: str) -> Tuple[bool, str]:
-        """Check all cooldown types and return (allowed, reason)."""
-        now = time.time()
+    def _check_message_cooldowns(self, channel_id: int, user_id: int) -> Tuple[bool, str]:
+        """Check the cooldowns that don't depend on which trigger matched."""
+        now = time.monotonic()
         
         # Global cooldown
         if now - self.last_global_reply < self.GLOBAL_COOLDOWN:
@@ -147,22 +263,40 @@ class AutoReply(commands.Cog):
             return False, "channel"
             
         # User cooldown
-        if now - self.user_cooldowns[user_id] < self.USER_COOLDOWN:
+        if now - self.user_cooldowns.get(user_id, 0) < self.USER_COOLDOWN:
             return False, "user"
             
-        # Trigger-specific cooldown
-        if now - self.trigger_cooldowns[trigger_key] < self.TRIGGER_COOLDOWN:
-            return False, "trigger"
-            
         return True, ""
 
+    @staticmethod
+    def _touch_cooldown(cooldowns: dict, key, now: float, window: float):
+        """Stamp `key` with `now` and evict entries whose cooldown has already lapsed."""
+        # Re-inserting moves the key to the end, so the oldest stamps are always first
+        cooldowns.pop(key, None)
+        cooldowns[key] = now
+        while (oldest := next(iter(cooldowns))) != key and now - cooldowns[oldest] >= window:
+            del cooldowns[oldest]
+
     def _update_all_cooldowns(self, channel_id: int, user_id: int, trigger_key: str):
         """Update all cooldown timers."""
-        now = time.time()
+        now = time.monotonic()
         self.last_global_reply = now
-        self.channel_cooldowns[channel_id] = now
-        self.user_cooldowns[user_id] = now
-        self.trigger_cooldowns[trigger_key] = now
+        self._touch_cooldown(self.channel_cooldowns, channel_id, now, self.CHANNEL_COOLDOWN)
+        self._touch_cooldown(self.user_cooldowns, user_id, now, self.USER_COOLDOWN)
+        self._touch_cooldown(self.trigger_cooldowns, trigger_key, now, self.TRIGGER_COOLDOWN)
+
+    def _resolve_match(self, guild_id: str, match: re.Match, content: str, guild_triggers: dict) -> Optional[Tuple[str, dict]]:
+        """Map a regex hit straight to its trigger, scanning only if the lookup misses."""
+        lookup = self.trigger_lookup.get(guild_id, {})
+        word = match.group(0)
+        # Keys are stored lowercase; most hits are typed lowercase too, so only
+        # lower() the matched text when the exact form isn't a key
+        main_trigger = lookup.get(word)
+        if main_trigger is None:
+            main_trigger = lookup.get(word.lower())
+        if main_trigger is not None and main_trigger in guild_triggers:
+            return main_trigger, guild_triggers[main_trigger]
+        return self._find_triggered_word(content, guild_triggers)
 
     def _find_triggered_word(self, content: str, guild_triggers: dict) -> Optional[Tuple[str, dict]]:
         """Find which trigger was activated and return trigger data."""
@@ -221,7 +355,8 @@ class AutoReply(commands.Cog):
         """Ultra-fast message check with comprehensive rate limiting and anti-spam."""
         self.performance_stats["total_checks"] += 1
         
-        if not message.guild:
+        # Most guilds have no triggers; reject them before any string or history work
+        if not message.guild or message.guild.id not in self._active_guild_ids:
             return False
             
         # Anti-spam check
@@ -229,63 +364,64 @@ class AutoReply(commands.Cog):
             return False
             
         guild_id = str(message.guild.id)
-        guild_regex = self.regex_cache.get(guild_id)
+        guild_regex = self._get_guild_regex(guild_id)
         
         if not guild_regex:
             self.performance_stats["regex_misses"] += 1
             return False
             
-        # Quick regex check first
-        if not guild_regex.search(message.content):
+        # Cooldowns that hold whatever the trigger is are checked before any
+        # text matching, so a busy channel doesn't pay for regex work it can't use
+        allowed, cooldown_type = self._check_message_cooldowns(message.channel.id, message.author.id)
+        if not allowed:
+            self.logger.debug(f"Auto-reply blocked by {cooldown_type} cooldown")
+            return False
+            
+        # Quick regex check
+        match = guild_regex.search(message.content)
+        if not match:
             return False
             
         self.performance_stats["cache_hits"] += 1
         
-        # Find exact trigger
+        # Resolve the matched text to its trigger with a dict lookup
         guild_triggers = self.all_replies_cache.get(guild_id, {})
-        trigger_result = self._find_triggered_word(message.content, guild_triggers)
+        trigger_result = self._resolve_match(guild_id, match, message.content, guild_triggers)
         
         if not trigger_result:
             return False
             
         main_trigger, trigger_data = trigger_result
         
-        # Check all cooldowns
-        allowed, cooldown_type = self._check_all_cooldowns(
-            message.channel.id, 
-            message.author.id, 
-            main_trigger
-        )
-        
-        if not allowed:
-            self.logger.debug(f"Auto-reply blocked by {cooldown_type} cooldown")
+        # Check the trigger cooldown (the others were checked above)
+        if time.monotonic() - self.trigger_cooldowns.get(main_trigger, 0) < self.TRIGGER_COOLDOWN:
+            self.logger.debug("Auto-reply blocked by trigger cooldown")
             return False
             
+        # Update cooldowns first
+        self._update_all_cooldowns(message.channel.id, message.author.id, main_trigger)
+        
+        # Get reply content with variable support
+        reply_content = await self._process_reply_content(trigger_data["reply"], message)
+        
+        # Send in the background so the message pipeline (and command handling)
+        # doesn't wait on Discord's REST round-trip
+        task = asyncio.create_task(self._send_reply(message, reply_content, guild_id, main_trigger))
+        self._pending_replies.add(task)
+        task.add_done_callback(self._pending_replies.discard)
+        return True
+
+    async def _send_reply(self, message: discord.Message, reply_content: str, guild_id: str, main_trigger: str):
+        """Send an auto-reply and record its usage; errors are logged, never raised."""
         try:
-            # Update cooldowns first
-            self._update_all_cooldowns(message.channel.id, message.author.id, main_trigger)
-            
-            # Get reply content with variable support
-            reply_content = await self._process_reply_content(trigger_data["reply"], message)
-            
-            # Send reply
             await message.reply(reply_content, mention_author=False)
             
             # Update statistics safely
             self.performance_stats["total_replies"] += 1
             self._safe_update_stats(guild_id, main_trigger)
-            
-            # Save stats periodically (with error handling)
-            if self.performance_stats["total_replies"] % 10 == 0:
-                try:
-                    # Convert defaultdict to regular dict for saving
-                    stats_to_save = dict(self.trigger_stats)
-                    await self.data_manager.save_data("auto_reply_stats", stats_to_save)
-                except Exception as e:
-                    self.logger.error(f"Error saving stats: {e}")
+            self._mark_dirty(stats=True)
                 
             self.logger.info(f"Auto-reply triggered: '{main_trigger}' in {message.guild.name}")
-            return True
             
         except discord.Forbidden:
             self.logger.warning(f"Missing permissions to reply in {message.guild.name}#{message.channel.name}")
@@ -295,8 +431,6 @@ class AutoReply(commands.Cog):
             self.logger.error(f"Unexpected error in auto-reply: {e}")
             import traceback
             self.logger.error(traceback.format_exc())
-            
-        return False
 
     async def _process_reply_content(self, reply_template: str, message: discord.Message) -> str:
         """Process reply content with variable substitution and multiple reply support."""
@@ -411,9 +545,9 @@ class AutoReply(commands.Cog):
             if not guild_triggers:
                 del self.all_replies_cache[guild_id]
         
-        # Save and update cache
-        await self.data_manager.save_data("auto_replies", self.all_replies_cache)
-        self._update_regex_for_guild(guild_id, guild_triggers)
+        # Queue save and update cache
+        self._mark_dirty(guild_id)
+        self._triggers_changed(guild_id)
         
         await interaction.followup.send(response_msg)
 
@@ -460,8 +594,8 @@ class AutoReply(commands.Cog):
         existing_alts_set.update(actually_added)
         guild_triggers[main_key]["alts"] = sorted(list(existing_alts_set))
         
-        await self.data_manager.save_data("auto_replies", self.all_replies_cache)
-        self._update_regex_for_guild(guild_id, guild_triggers)
+        self._mark_dirty(guild_id)
+        self._triggers_changed(guild_id)
         
         await interaction.followup.send(
             f"Okay, I've added `{', '.join(actually_added)}` as alternatives for `{main_trigger}`."
@@ -538,9 +672,8 @@ class AutoReply(commands.Cog):
                       if k.startswith(f"{guild_id}:")}
         
         if guild_stats:
-            top_triggers = sorted(guild_stats.items(), 
-                                key=lambda x: x[1]["count"], 
-                                reverse=True)[:5]
+            top_triggers = heapq.nlargest(5, guild_stats.items(), 
+                                          key=lambda x: x[1]["count"])
             
             top_list = []
             for key, data in top_triggers:
@@ -564,20 +697,21 @@ class AutoReply(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         
         guild_id = str(interaction.guild.id)
-        guild_regex = self.regex_cache.get(guild_id)
+        guild_regex = self._get_guild_regex(guild_id)
         
         if not guild_regex:
             return await interaction.followup.send(
                 "No auto-replies are configured for this server."
             )
             
-        if not guild_regex.search(test_message):
+        match = guild_regex.search(test_message)
+        if not match:
             return await interaction.followup.send(
                 f"No triggers found in: `{test_message}`"
             )
             
         guild_triggers = self.all_replies_cache.get(guild_id, {})
-        trigger_result = self._find_triggered_word(test_message, guild_triggers)
+        trigger_result = self._resolve_match(guild_id, match, test_message, guild_triggers)
         
         if not trigger_result:
             return await interaction.followup.send(
@@ -5,7 +5,7 @@ from discord import app_commands
 import logging
 import re
 import asyncio
-from typing import Dict, Optional, Set
+from typing import Dict, Optional, Set, Tuple
 
 from utils.websites import all_websites, Website
 from config.personalities import PERSONALITY_RESPONSES
@@ -94,6 +94,8 @@ class LinkFixer(commands.Cog):
 
         # Caching and pattern compilation
         self.settings_cache: Dict = {}
+        # Flattened (guild_id, user_id, website) opt-outs, rebuilt from settings_cache on load/edit
+        self._opted_out: Set[Tuple[int, int, str]] = set()
         self.website_map: Dict[str, Website] = {}
         self.combined_pattern: Optional[re.Pattern] = None
         self.markdown_link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
@@ -127,6 +129,7 @@ class LinkFixer(commands.Cog):
         
         # Load cached settings
         self.settings_cache = await self.data_manager.get_data("link_fixer_settings") or {}
+        self._build_opt_out_index()
         
         # Build combined regex pattern for all websites
         patterns = []
@@ -179,11 +182,6 @@ class LinkFixer(commands.Cog):
                 self.logger.error(f"Error in link fixer periodic save: {e}", exc_info=True)
                 await asyncio.sleep(self.SAVE_INTERVAL * 2)  # Wait longer after error
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        """Listen for messages containing fixable links."""
-        await self.check_and_fix_link(message)
-
     async def check_and_fix_link(self, message: discord.Message) -> bool:
         """Check if a message contains fixable links and process them."""
         # Basic validation
@@ -299,15 +297,19 @@ class LinkFixer(commands.Cog):
             # Remove processing reaction
             await self._remove_reaction(message, "⏳")
 
+    def _build_opt_out_index(self):
+        """Flatten the nested settings into a set of opt-outs for O(1) per-link checks."""
+        self._opted_out = {
+            (int(guild_id), int(user_id), website)
+            for guild_id, guild_settings in self.settings_cache.items()
+            for user_id, user_settings in guild_settings.get("users", {}).items()
+            for website, enabled in user_settings.items()
+            if not enabled
+        }
+
     def _is_user_opted_in(self, guild_id: int, user_id: int, website_name: str) -> bool:
         """Check if user has opted in for this website's link fixing."""
-        user_settings = (
-            self.settings_cache
-            .get(str(guild_id), {})
-            .get("users", {})
-            .get(str(user_id), {})
-        )
-        return user_settings.get(website_name, True)  # Default to enabled
+        return (guild_id, user_id, website_name) not in self._opted_out  # Default to enabled
 
     async def _add_reaction(self, message: discord.Message, emoji: str):
         """Add a reaction to a message, ignoring errors."""
@@ -392,6 +394,11 @@ class LinkFixer(commands.Cog):
         user_settings = self.settings_cache[guild_id]["users"][user_id]
         new_state_bool = (state == "on")
         user_settings[website] = new_state_bool
+        opt_out_key = (interaction.guild.id, interaction.user.id, website)
+        if new_state_bool:
+            self._opted_out.discard(opt_out_key)
+        else:
+            self._opted_out.add(opt_out_key)
         
         # Mark as dirty for periodic save
         self._is_dirty.set()
@@ -120,22 +120,26 @@ class WordBlocker(commands.Cog):
         self.performance_stats["total_checks"] += 1
         if not message.guild or message.author.bot: return False
 
-        content_lower = message.content.lower()
-        content_stripped = content_lower.strip()
-        
-        # --- NEW: Link Whitelisting Logic ---
-        if ('http://' in content_lower or 'https://' in content_lower) and 'tenor.com' not in content_lower:
-            return False
-
+        # Guilds without a blocklist are rejected before any string work
         guild_id = str(message.guild.id)
         guild_data = self.blocklist_cache.get(guild_id)
         if not guild_data: return False
         
         patterns = self.compiled_patterns.get(guild_id)
         if not patterns: return False
+
+        content_lower = message.content.lower()
+        
+        # --- NEW: Link Whitelisting Logic ---
+        # Most messages have no '://', so a single scan settles the common case
+        if '://' in content_lower and ('http://' in content_lower or 'https://' in content_lower) and 'tenor.com' not in content_lower:
+            return False
+
+        content_stripped = content_lower.strip()
+        user_id = str(message.author.id)
         
         # --- 1. Exact Match Check (Fastest) ---
-        user_blocks = guild_data.get("users", {}).get(str(message.author.id), {})
+        user_blocks = guild_data.get("users", {}).get(user_id, {})
         if content_stripped in user_blocks.get("exact", {}):
             await self._handle_blocked_message(message, content_stripped)
             return True
@@ -157,7 +161,7 @@ class WordBlocker(commands.Cog):
             self.performance_stats["regex_cache_hits"] += 1
             
         if not triggered_word:
-            user_pattern = patterns.get("users", {}).get(str(message.author.id))
+            user_pattern = patterns.get("users", {}).get(user_id)
             if user_pattern and (match := user_pattern.search(content_lower)):
                 triggered_word = match.group()
                 self.performance_stats["regex_cache_hits"] += 1
@@ -175,13 +179,20 @@ class WordBlocker(commands.Cog):
             self.logger.warning(f"Failed to delete message: {e}")
             return
 
-        self.user_violations[message.author.id].append(time.time())
-        violation_level = len(self.user_violations[message.author.id])
+        # Drop violations older than the escalation window from the front;
+        # timestamps are appended in order, so this is O(1) amortized.
+        violations = self.user_violations[message.author.id]
+        now = time.monotonic()
+        cutoff = now - self.ESCALATION_WINDOW
+        while violations and violations[0] <= cutoff:
+            violations.popleft()
+        violations.append(now)
+        violation_level = len(violations)
         await self._send_warning(message, trigger_word, violation_level)
 
     async def _send_warning(self, message: discord.Message, trigger_word: str, violation_level: int):
         channel_id = message.channel.id
-        now = time.time()
+        now = time.monotonic()
         if now - self.channel_warning_cooldowns.get(channel_id, 0) < self.WARNING_COOLDOWN: return
         
         self.channel_warning_cooldowns[channel_id] = now
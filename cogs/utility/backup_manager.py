@@ -46,11 +46,11 @@ class BackupManager(commands.Cog):
             await interaction.edit_original_response(content=message)
 
         elif action == "list":
-            backups = await self.backup_service.list_backups()
+            backups = await self.backup_service.list_backups(limit=list_count)
             if not backups:
                 return await interaction.followup.send("No backups found. Maybe create one first?")
             
-            backup_list = [f"{i+1}. `{backup.get('name', 'Unknown')}`" for i, backup in enumerate(backups[:list_count])]
+            backup_list = [f"{i}. `{backup.get('name', 'Unknown')}`" for i, backup in enumerate(backups, 1)]
                     
             embed = discord.Embed(
                 title=f"Showing {len(backup_list)} Most Recent Backups",
@@ -154,7 +154,7 @@ class CustomRoles(commands.Cog):
             return await interaction.followup.send(self.personality["invalid_color"])
 
         # Get current target role based on CURRENT permissions
-        member = await interaction.guild.fetch_member(interaction.user.id)
+        member = await self._interaction_member(interaction)
         target_role = await self._get_current_target_role(member)
         if not target_role:
             return await interaction.followup.send("❌ An admin needs to set a target role first.")
@@ -222,7 +222,7 @@ class CustomRoles(commands.Cog):
             
             if primary is not None:
                 # Get current target role based on CURRENT permissions
-                member = await interaction.guild.fetch_member(interaction.user.id)
+                member = await self._interaction_member(interaction)
                 target_role = await self._get_current_target_role(member)
                 if not target_role:
                     return await interaction.followup.send("❌ Target role not set.")
@@ -373,10 +373,11 @@ class CustomRoles(commands.Cog):
 
         # Build the description string
         description_lines = []
-        sorted_user_ids = sorted(user_roles_map.keys(), key=lambda uid: (interaction.guild.get_member(uid).display_name if interaction.guild.get_member(uid) else str(uid)).lower())
+        members = {uid: interaction.guild.get_member(uid) for uid in user_roles_map}
+        sorted_user_ids = sorted(members, key=lambda uid: (members[uid].display_name if members[uid] else str(uid)).lower())
 
         for user_id in sorted_user_ids:
-            user = interaction.guild.get_member(user_id)
+            user = members[user_id]
             user_mention = user.mention if user else f"<@{user_id}> (User Left)"
             
             description_lines.append(f"**{user_mention}**:")
@@ -506,6 +507,13 @@ class CustomRoles(commands.Cog):
         except ValueError:
             return None
 
+    @staticmethod
+    async def _interaction_member(interaction: discord.Interaction) -> discord.Member:
+        """The invoking member with the roles from the interaction payload; REST fetch only as a fallback."""
+        if isinstance(interaction.user, discord.Member):
+            return interaction.user
+        return await interaction.guild.fetch_member(interaction.user.id)
+
     async def _position_role_safely(self, role: discord.Role, target_pos: int) -> bool:
         """Safely position a role with retry logic and rate limiting."""
         if role.position == target_pos:
@@ -517,12 +525,11 @@ class CustomRoles(commands.Cog):
         for attempt in range(max_retries):
             try:
                 async with self._position_lock:
-                    await role.edit(position=target_pos, reason="Positioning Tika Custom Role")
-                    await asyncio.sleep(0.5)
+                    edited = await role.edit(position=target_pos, reason="Positioning Tika Custom Role")
                     
-                    # Verify the position was actually set
-                    fresh_role = role.guild.get_role(role.id)
-                    if fresh_role and fresh_role.position == target_pos:
+                    # Verify against the role returned by the API rather than
+                    # sleeping and hoping the cache has caught up.
+                    if edited and edited.position == target_pos:
                         return True
                         
             except (discord.Forbidden, discord.HTTPException) as e:
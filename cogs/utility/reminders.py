@@ -17,6 +17,7 @@ from cogs.admin.bot_admin import is_bot_admin
 class Reminders(commands.Cog):
     # Pre-compile regex for a small performance boost
     TIME_PATTERN = re.compile(r"(\d+)\s*(d|w|h|m|s|day|week|hour|minute|second)s?", re.IGNORECASE)
+    MAX_CONCURRENT_NOTIFICATIONS = 8  # Bound on DMs/channel sends in flight at once
 
     def __init__(self, bot):
         self.bot = bot
@@ -30,6 +31,7 @@ class Reminders(commands.Cog):
         
         # Event-driven system for the main loop
         self._loop_wakeup_event = asyncio.Event()
+        self._notify_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_NOTIFICATIONS)
         
         # Background saving mechanism
         self._is_dirty = asyncio.Event()
@@ -114,8 +116,9 @@ class Reminders(commands.Cog):
                     due_reminders.append(self.reminders_cache.pop(0))
                 
                 if due_reminders:
+                    # Deliver concurrently so one slow or failing send doesn't hold up the rest
+                    await asyncio.gather(*(self._send_notification_safely(item) for item in due_reminders))
                     for item in due_reminders:
-                        await self._send_notification(item)
                         if item.get("repeat_interval"):
                             if next_item := self._create_next_occurrence(item):
                                 self._add_reminder(next_item)
@@ -217,6 +220,14 @@ class Reminders(commands.Cog):
                 return True
         return False
 
+    async def _send_notification_safely(self, item: dict):
+        """Send one reminder under the concurrency bound, isolating its errors from the batch."""
+        async with self._notify_semaphore:
+            try:
+                await self._send_notification(item)
+            except Exception as e:
+                self.logger.error(f"Failed to deliver reminder {item.get('id')}: {e}")
+
     async def _send_notification(self, item: dict):
         user = self.bot.get_user(item["user_id"])
         if not user: return
@@ -3,9 +3,16 @@
 import discord
 from discord.ext import commands
 from ddgs import DDGS
-from urllib.parse import urlparse
 import asyncio
-from datetime import datetime, timedelta
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+# Host part of a result URL, minus a leading "www." (compiled once; used per result on every page)
+_DOMAIN_RE = re.compile(r'^(?:[a-z][a-z0-9+.-]*:)?//(?:www\.)?([^/?#]+)', re.IGNORECASE)
+
 
 class SearchView(discord.ui.View):
     def __init__(self, cog, query: str, all_results: list, shown_indices: set, author_id: int):
@@ -43,10 +50,7 @@ class SearchView(discord.ui.View):
             url = result.get('href', '')
             body = result.get('body', 'No description available.')
             
-            try:
-                domain = urlparse(url).netloc.replace('www.', '')
-            except:
-                domain = url
+            domain = m.group(1) if (m := _DOMAIN_RE.match(url)) else url
             
             body = ' '.join(body.split())
             if len(body) > 200:
@@ -95,6 +99,7 @@ class SearchView(discord.ui.View):
                         max_results=20
                     ))
             
+            await self.cog.acquire_search_slot()
             new_results = await asyncio.to_thread(_search)
             
             # Filter out already shown results
@@ -137,10 +142,34 @@ class SearchView(discord.ui.View):
         self.stop()
 
 class Search(commands.Cog):
+    CACHE_SIZE = 100
+    CACHE_TTL = 600  # Seconds a result set stays fresh
+    NEGATIVE_CACHE_TTL = 60  # Shorter lifetime for searches that found nothing
+    SEARCH_RATE = 20  # Outbound searches allowed per SEARCH_PERIOD (token bucket)
+    SEARCH_PERIOD = 60.0
+    # (prefix, action) pairs for quick actions, built once rather than on every search message
+    QUICK_ACTION_PREFIXES = tuple(
+        (keyword + ' ', action)
+        for action, keywords in (
+            ('define', ('define', 'definition', 'meaning')),
+            ('weather', ('weather', 'forecast')),
+            ('wiki', ('wiki', 'wikipedia')),
+            ('calc', ('calc', 'calculate', 'math')),
+            ('time', ('time', 'clock')),
+        )
+        for keyword in keywords
+    )
+
     def __init__(self, bot):
         self.bot = bot
-        self.search_cache = {}  # Simple cache: {query: (results, timestamp)}
-        self.cache_duration = timedelta(minutes=10)
+        # LRU cache: {(normalized query, max_results): (expires_at, results)}
+        self.search_cache: OrderedDict[Tuple[str, int], Tuple[float, list]] = OrderedDict()
+        # Searches currently running, so concurrent identical queries share one request
+        self._inflight: Dict[Tuple[str, int], asyncio.Task] = {}
+        # Token bucket so bursts are smoothed client-side instead of getting us rate limited
+        self._search_tokens = float(self.SEARCH_RATE)
+        self._tokens_updated = time.monotonic()
+        self._rate_lock = asyncio.Lock()
 
     async def _is_feature_enabled(self, guild_id: int) -> bool:
         """A local check to see if the web_search feature is enabled."""
@@ -149,32 +178,69 @@ class Search(commands.Cog):
         
         return feature_manager and feature_manager.is_feature_enabled(guild_id, feature_name)
     
-    def get_cached_results(self, query: str):
+    async def acquire_search_slot(self):
+        """Wait until the token bucket allows another outbound search."""
+        refill_per_sec = self.SEARCH_RATE / self.SEARCH_PERIOD
+        async with self._rate_lock:  # Waiters queue in order behind the lock
+            while True:
+                now = time.monotonic()
+                self._search_tokens = min(self.SEARCH_RATE, self._search_tokens + (now - self._tokens_updated) * refill_per_sec)
+                self._tokens_updated = now
+                if self._search_tokens >= 1:
+                    self._search_tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._search_tokens) / refill_per_sec)
+    
+    @staticmethod
+    def _cache_key(query: str, max_results: int) -> Tuple[str, int]:
+        """Normalize case and whitespace so trivially different queries share an entry."""
+        return ' '.join(query.lower().split()), max_results
+    
+    def get_cached_results(self, query: str, max_results: int) -> Optional[list]:
         """Get cached results if they exist and aren't expired."""
-        if query in self.search_cache:
-            results, timestamp = self.search_cache[query]
-            if datetime.now() - timestamp < self.cache_duration:
-                return results
-            else:
-                del self.search_cache[query]
-        return None
+        key = self._cache_key(query, max_results)
+        entry = self.search_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if time.monotonic() >= expires_at:
+            del self.search_cache[key]
+            return None
+        self.search_cache.move_to_end(key)
+        return results
     
-    def cache_results(self, query: str, results: list):
-        """Cache search results."""
-        self.search_cache[query] = (results, datetime.now())
-        
-        # Clean old cache entries if cache gets too large
-        if len(self.search_cache) > 100:
-            oldest = min(self.search_cache.items(), key=lambda x: x[1][1])
-            del self.search_cache[oldest[0]]
+    def cache_results(self, query: str, max_results: int, results: list):
+        """Cache search results, evicting the least recently used entry when full."""
+        key = self._cache_key(query, max_results)
+        ttl = self.CACHE_TTL if results else self.NEGATIVE_CACHE_TTL
+        self.search_cache[key] = (time.monotonic() + ttl, results)
+        self.search_cache.move_to_end(key)
+        if len(self.search_cache) > self.CACHE_SIZE:
+            self.search_cache.popitem(last=False)
     
     async def perform_search(self, query: str, max_results: int = 10):
         """Perform a web search with caching."""
         # Check cache first
-        cached = self.get_cached_results(query)
-        if cached:
+        cached = self.get_cached_results(query, max_results)
+        if cached is not None:
             return cached
         
+        key = self._cache_key(query, max_results)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_results(query, max_results))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        # Shielded so one caller giving up doesn't cancel the search for the others
+        return await asyncio.shield(task)
+    
+    def _finish_inflight(self, key: Tuple[str, int], task: asyncio.Task):
+        self._inflight.pop(key, None)
+        # Retrieve any error here so a search whose callers all gave up doesn't log "never retrieved"
+        if not task.cancelled(): task.exception()
+
+    async def _fetch_results(self, query: str, max_results: int):
+        """Run the blocking search off the event loop and cache what it returns."""
         # Perform new search in thread to avoid blocking
         def _search():
             with DDGS() as ddgs:
@@ -185,10 +251,11 @@ class Search(commands.Cog):
                     max_results=max_results
                 ))
         
+        await self.acquire_search_slot()
         results = await asyncio.to_thread(_search)
         
         # Cache results
-        self.cache_results(query, results)
+        self.cache_results(query, max_results, results)
         return results
     
     async def handle_quick_action(self, message: discord.Message, action: str, query: str):
@@ -434,39 +501,30 @@ class Search(commands.Cog):
         
         query_full = parts[1]
         
-        # Check for quick actions
-        quick_actions = {
-            'define': ['define', 'definition', 'meaning'],
-            'weather': ['weather', 'forecast'],
-            'wiki': ['wiki', 'wikipedia'],
-            'calc': ['calc', 'calculate', 'math'],
-            'time': ['time', 'clock']
-        }
-        
         # Check if query starts with a quick action
         query_lower = query_full.lower()
-        for action, keywords in quick_actions.items():
-            for keyword in keywords:
-                if query_lower.startswith(keyword + ' '):
-                    query_content = query_full[len(keyword):].strip()
-                    async with message.channel.typing():
-                        handled = await self.handle_quick_action(message, action, query_content)
-                        if handled:
-                            return
-                    break
+        for prefix, action in self.QUICK_ACTION_PREFIXES:
+            if query_lower.startswith(prefix):
+                query_content = query_full[len(prefix):].strip()
+                async with message.channel.typing():
+                    handled = await self.handle_quick_action(message, action, query_content)
+                    if handled:
+                        return
+                break
 
         # Regular search
         query = query_full
 
         try:
-            # Send initial "searching" message
+            # Start the search first so it runs while the "searching" reply round-trips to Discord
+            search_task = asyncio.create_task(self.perform_search(query, max_results=15))
             search_msg = await message.reply(
                 f"🔎 Searching for **{query}**...",
                 mention_author=False
             )
             
             async with message.channel.typing():
-                search_results = await self.perform_search(query, max_results=15)
+                search_results = await search_task
 
                 if not search_results:
                     await search_msg.edit(content=f"I couldn't find anything for `{query}`. Try being less obscure.")
@@ -488,6 +546,9 @@ class Search(commands.Cog):
                 await search_msg.edit(content=None, embed=embed, view=view)
 
         except Exception as e:
+            # The reply can fail (e.g. Forbidden) before the search is awaited. Cancelling only detaches
+            # this caller; the shared fetch in _inflight still finishes and caches its results.
+            if not search_task.done(): search_task.cancel()
             self.bot.logger.error(f"Error during DDGS search for query '{query}': {e}")
             await message.reply(
                 "Something went wrong with the search. It's probably a 'you' problem.",
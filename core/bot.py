@@ -4,14 +4,13 @@ import discord
 from discord.ext import commands
 from discord.errors import ConnectionClosed, GatewayNotFound, HTTPException
 import logging
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import aiohttp
 import asyncio
 import random
 import traceback
 import time
-
-from polars import datetime
+from datetime import datetime
 
 from config.settings import Settings
 from services.github_backup_service import GitHubBackupService
@@ -19,6 +18,16 @@ from services.data_manager import DataManager
 from services.resource_monitor import ResourceMonitor
 
 class TikaBot(commands.Bot):
+    # Message features in processing order: (feature_name, cog_name, check_method, handle_method)
+    MESSAGE_FEATURES = (
+        ("detention_system", "Detention", "is_user_detained", "handle_detention_message"),
+        ("word_blocker", "WordBlocker", "check_and_handle_message", None),
+        ("link_fixer", "LinkFixer", "check_and_fix_link", None),
+        ("auto_reply", "AutoReply", "check_for_reply", None),
+        ("word_game", "WordGame", "check_word_game_message", None),
+    )
+    MAX_TRACKED_USERS = 10_000  # Cap on per-user last-message entries kept in memory
+
     def __init__(self, settings: Settings):
         intents = discord.Intents.default()
         intents.message_content = True
@@ -39,7 +48,7 @@ class TikaBot(commands.Bot):
         # Bot state tracking
         self.command_usage = defaultdict(lambda: defaultdict(list))
         self.start_time: Optional[datetime] = None
-        self.last_message_times = {}  # Track when users last messaged
+        self.last_message_times = OrderedDict()  # Track when users last messaged (LRU, capped)
         self.typing_delays = {}  # Add realistic typing delays
         
         # Network resilience settings
@@ -51,6 +60,10 @@ class TikaBot(commands.Bot):
         # Error tracking
         self.error_count = defaultdict(int)
         self.last_errors = {}
+        
+        # Cog handles for on_message, resolved once after the cogs are loaded
+        self._feature_manager = None
+        self._message_handlers = []
 
     async def setup_hook(self):
         """Initialize services and load cogs with enhanced error handling."""
@@ -83,6 +96,7 @@ class TikaBot(commands.Bot):
             
             # Load cogs with better error handling
             await self._load_cogs_safely()
+            self._build_message_handlers()
             
             # Sync commands with retry logic
             await self._sync_commands_with_retry()
@@ -177,6 +191,10 @@ class TikaBot(commands.Bot):
                 except Exception as e:
                     self.logger.error(f"Error saving bot data: {e}")
                 
+            # Close the backup service's GitHub session
+            if self.backup_service:
+                await self.backup_service.close()
+                
             # Close HTTP session safely
             if hasattr(self, 'http_session') and self.http_session and not self.http_session.closed:
                 await self.http_session.close()
@@ -258,7 +276,7 @@ class TikaBot(commands.Bot):
             if message.author.bot or not message.guild:
                 return
                 
-            feature_manager = self.get_cog("FeatureManager")
+            feature_manager = self._feature_manager
             if not feature_manager:
                 # Process commands even if feature manager is unavailable
                 ctx = await self.get_context(message)
@@ -267,7 +285,11 @@ class TikaBot(commands.Bot):
                 return
 
             # Track message timing for better interaction
-            self.last_message_times[message.author.id] = discord.utils.utcnow()
+            last_times = self.last_message_times
+            last_times[message.author.id] = discord.utils.utcnow()
+            last_times.move_to_end(message.author.id)
+            if len(last_times) > self.MAX_TRACKED_USERS:
+                last_times.popitem(last=False)
 
             # All AI-related checks (mentions, replies) have been removed from here.
 
@@ -282,38 +304,33 @@ class TikaBot(commands.Bot):
         except Exception as e:
             self.logger.error(f"Error in on_message: {e}", exc_info=True)
 
+    def _build_message_handlers(self):
+        """Resolve the message feature cogs and their bound methods once, instead of per message."""
+        self._feature_manager = self.get_cog("FeatureManager")
+        handlers = []
+        for feature_name, cog_name, check_method, handle_method in self.MESSAGE_FEATURES:
+            cog = self.get_cog(cog_name)
+            check = getattr(cog, check_method, None) if cog else None
+            if not check:
+                continue
+            handle = getattr(cog, handle_method, None) if handle_method else None
+            handlers.append((feature_name, check, handle))
+        self._message_handlers = handlers
+
     async def _process_message_features(self, message, feature_manager):
         """Process message through various features with error isolation."""
-        features_to_check = [
-            ("detention_system", "Detention", "is_user_detained", "handle_detention_message"),
-            ("word_blocker", "WordBlocker", "check_and_handle_message", None),
-            ("link_fixer", "LinkFixer", "check_and_fix_link", None),
-            ("auto_reply", "AutoReply", "check_for_reply", None),
-            ("word_game", "WordGame", "check_word_game_message", None),
-        ]
-        
-        for feature_name, cog_name, check_method, handle_method in features_to_check:
-            if not feature_manager.is_feature_enabled(message.guild.id, feature_name):
+        guild_id = message.guild.id
+        for feature_name, check, handle in self._message_handlers:
+            if not feature_manager.is_feature_enabled(guild_id, feature_name):
                 continue
                 
             try:
-                cog = self.get_cog(cog_name)
-                if not cog:
-                    continue
-                    
-                # Handle detention system specially
-                if feature_name == "detention_system":
-                    if hasattr(cog, check_method):
-                        if await getattr(cog, check_method)(message):
-                            if handle_method and hasattr(cog, handle_method):
-                                await getattr(cog, handle_method)(message)
-                            return  # Stop processing other features
-                else:
-                    # Handle other features
-                    if hasattr(cog, check_method):
-                        result = await getattr(cog, check_method)(message)
-                        if result:
-                            return  # Stop processing if feature handled the message
+                # A feature that claims the message stops further processing;
+                # detention additionally hands the message to its handler.
+                if await check(message):
+                    if handle:
+                        await handle(message)
+                    return
                             
             except Exception as e:
                 self.logger.error(f"Error in {feature_name} feature: {e}")
@@ -1,13 +1,18 @@
 # services/data_manager.py
 import logging
 import aiofiles
-import json
+import orjson
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 from collections import defaultdict
 import asyncio
 
 FILE_LOCKS = defaultdict(asyncio.Lock)
+# Serializes the first load of a dataset so concurrent callers share one parse
+LOAD_LOCKS = defaultdict(asyncio.Lock)
+# Keeps the indented on-disk format; non-str keys lets int-keyed caches be saved as-is
+_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
 class DataManager:
     def __init__(self, base_path: Path):
@@ -22,34 +27,145 @@ class DataManager:
 
         async with FILE_LOCKS[file_name]:
             try:
-                async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+                async with aiofiles.open(file_path, 'rb') as f:
                     content = await f.read()
-                    return json.loads(content) if content else {}
+                    return orjson.loads(content) if content else {}
             except Exception as e:
                 self.logger.error(f"Failed to read or parse {file_name}", exc_info=e)
                 return {}
 
     async def _write_file(self, file_name: str, data: Dict):
         file_path = self.base_path / file_name
+        # Write to a temp file and swap it in, so a crash mid-write can't truncate the dataset.
+        tmp_path = file_path.with_name(f"{file_path.name}.tmp")
         async with FILE_LOCKS[file_name]:
             try:
-                async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                    await f.write(json.dumps(data, indent=2, ensure_ascii=False))
+                async with aiofiles.open(tmp_path, 'wb') as f:
+                    await f.write(orjson.dumps(data, option=_DUMP_OPTIONS))
+                os.replace(tmp_path, file_path)
                 self.cache[file_name] = data # Update cache on successful write
             except Exception as e:
                 self.logger.error(f"Failed to write to {file_name}", exc_info=e)
 
     async def get_data(self, data_type: str) -> Dict:
-        """Gets the entire dataset for a type (e.g., 'bot_admins'). Uses cache."""
+        """Gets the entire dataset for a type (e.g., 'bot_admins'). Uses cache.
+
+        Every caller receives the same dict object (never a copy), so cogs can
+        keep it as their in-memory source of truth and mutate it in place.
+        The file is only read and parsed the first time.
+        """
         file_name = f"{data_type}.json"
         if file_name in self.cache:
             return self.cache[file_name]
         
-        data = await self._read_file(file_name)
-        self.cache[file_name] = data
-        return data
+        async with LOAD_LOCKS[file_name]:
+            # Another caller may have finished loading while we waited
+            if file_name in self.cache:
+                return self.cache[file_name]
+            data = await self._read_file(file_name)
+            self.cache[file_name] = data
+            return data
 
     async def save_data(self, data_type: str, data: Dict):
         """Saves the entire dataset for a type."""
         file_name = f"{data_type}.json"
-        await self._write_file(file_name, data)
\ No newline at end of file
+        await self._write_file(file_name, data)
+
+    async def get_shards(self, data_type: str) -> Dict[str, Dict]:
+        """Loads every shard of a sharded dataset (data/<type>/<shard_id>.json), keyed by shard id."""
+        shard_dir = self.base_path / data_type
+        if not shard_dir.is_dir():
+            return {}
+
+        shards = {}
+        for file_path in shard_dir.glob("*.json"):
+            shards[file_path.stem] = await self._read_file(f"{data_type}/{file_path.name}")
+        return shards
+
+    async def save_shard(self, data_type: str, shard_id: str, data: Dict) -> bool:
+        """Atomically writes a single shard so only the changed part of a dataset is re-encoded. Returns success."""
+        file_name = f"{data_type}/{shard_id}.json"
+        file_path = self.base_path / file_name
+        tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+        async with FILE_LOCKS[file_name]:
+            try:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                async with aiofiles.open(tmp_path, 'wb') as f:
+                    await f.write(orjson.dumps(data, option=_DUMP_OPTIONS))
+                os.replace(tmp_path, file_path)
+                return True
+            except Exception as e:
+                self.logger.error(f"Failed to write shard {file_name}", exc_info=e)
+                return False
+
+    async def delete_shard(self, data_type: str, shard_id: str) -> bool:
+        """Removes a shard that no longer holds any data. Returns success."""
+        file_name = f"{data_type}/{shard_id}.json"
+        async with FILE_LOCKS[file_name]:
+            try:
+                (self.base_path / file_name).unlink(missing_ok=True)
+                return True
+            except Exception as e:
+                self.logger.error(f"Failed to delete shard {file_name}", exc_info=e)
+                return False
+
+    async def append_event(self, log_name: str, event: Dict):
+        """Appends one event as a JSON line to data/<log_name>.log."""
+        file_name = f"{log_name}.log"
+        async with FILE_LOCKS[file_name]:
+            try:
+                async with aiofiles.open(self.base_path / file_name, 'ab') as f:
+                    await f.write(orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+            except Exception as e:
+                self.logger.error(f"Failed to append to {file_name}", exc_info=e)
+
+    async def rotate_events(self, log_name: str):
+        """Moves the active event log aside so new events go to a fresh file while a snapshot is written."""
+        file_name = f"{log_name}.log"
+        file_path = self.base_path / file_name
+        rotated_path = self.base_path / f"{file_name}.old"
+        async with FILE_LOCKS[file_name]:
+            try:
+                if not file_path.exists():
+                    return
+                if rotated_path.exists():
+                    # A previous snapshot never finished; keep both logs, oldest first
+                    async with aiofiles.open(file_path, 'rb') as f:
+                        content = await f.read()
+                    async with aiofiles.open(rotated_path, 'ab') as f:
+                        await f.write(content)
+                    file_path.unlink()
+                else:
+                    os.replace(file_path, rotated_path)
+            except Exception as e:
+                self.logger.error(f"Failed to rotate {file_name}", exc_info=e)
+
+    async def discard_rotated_events(self, log_name: str):
+        """Deletes the rotated event log once a snapshot covering it has been written."""
+        file_name = f"{log_name}.log"
+        async with FILE_LOCKS[file_name]:
+            try:
+                (self.base_path / f"{file_name}.old").unlink(missing_ok=True)
+            except Exception as e:
+                self.logger.error(f"Failed to discard rotated {file_name}", exc_info=e)
+
+    async def read_events(self, log_name: str) -> List[Dict]:
+        """Reads the rotated and active event logs, oldest first. A torn last line is skipped."""
+        file_name = f"{log_name}.log"
+        events = []
+        async with FILE_LOCKS[file_name]:
+            for path in (self.base_path / f"{file_name}.old", self.base_path / file_name):
+                if not path.exists():
+                    continue
+                try:
+                    async with aiofiles.open(path, 'rb') as f:
+                        content = await f.read()
+                except Exception as e:
+                    self.logger.error(f"Failed to read {path.name}", exc_info=e)
+                    continue
+                for line in content.splitlines():
+                    try:
+                        events.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        self.logger.warning(f"Skipping unreadable line in {path.name}")
+        return events
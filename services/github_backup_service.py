@@ -3,7 +3,9 @@ import logging
 import shutil
 import base64
 import aiohttp
+import orjson
 import asyncio
+import heapq
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Tuple
@@ -18,12 +20,31 @@ class GitHubBackupService:
         self.base_url = "https://api.github.com"
         # The loop will be injected by the cog after initialization.
         self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._headers = {'Authorization': f'token {self.token}', 'Accept': 'application/vnd.github.v3+json'}
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Credentials never change after startup, so readiness is decided (and warned about) once.
+        self._ready = bool(self.token and self.repo)
+        if not self._ready:
+            self.logger.warning("GitHub token or repository not configured.")
 
     def is_ready(self) -> bool:
-        if not self.token or not self.repo:
-            self.logger.warning("GitHub token or repository not configured.")
-            return False
-        return True
+        return self._ready
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily creates one keep-alive session for all GitHub API calls."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=10,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(connector=connector, headers=self._headers)
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
 
     async def _create_zip_non_blocking(self, archive_name_base: str) -> Path:
         """Runs the blocking zip operation in a separate thread to not freeze the bot."""
@@ -34,6 +55,10 @@ class GitHubBackupService:
             None, shutil.make_archive, archive_name_base, 'zip', self.settings.DATA_DIR
         )
 
+    @staticmethod
+    def _encode_file(path: Path) -> str:
+        return base64.b64encode(path.read_bytes()).decode('utf-8')
+
     async def perform_backup(self) -> Tuple[bool, str]:
         if not self.is_ready():
             return False, "Backup service is not configured."
@@ -49,23 +74,21 @@ class GitHubBackupService:
             if not zip_filepath.exists():
                 raise FileNotFoundError("Failed to create zip archive in executor.")
 
-            with open(zip_filepath, 'rb') as f:
-                content = base64.b64encode(f.read()).decode('utf-8')
+            # Reading and encoding the whole archive is blocking work; keep it off the event loop
+            content = await asyncio.to_thread(self._encode_file, zip_filepath)
 
             file_path_in_repo = f"backups/{zip_filepath.name}"
             url = f"{self.base_url}/repos/{self.repo}/contents/{file_path_in_repo}"
-            headers = {'Authorization': f'token {self.token}', 'Accept': 'application/vnd.github.v3+json'}
             data = {'message': f'Automated backup - {timestamp}', 'content': content, 'branch': 'main'}
 
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.put(url, json=data) as response:
-                    if response.status == 201:
-                        self.logger.info(f"Successfully uploaded backup to GitHub: {file_path_in_repo}")
-                        return True, "Backup complete. Your data is safe, I suppose."
-                    else:
-                        error_text = await response.text()
-                        self.logger.error(f"GitHub upload failed: {response.status} - {error_text}")
-                        return False, f"GitHub upload failed with status {response.status}."
+            async with self._get_session().put(url, json=data) as response:
+                if response.status == 201:
+                    self.logger.info(f"Successfully uploaded backup to GitHub: {file_path_in_repo}")
+                    return True, "Backup complete. Your data is safe, I suppose."
+                else:
+                    error_text = await response.text()
+                    self.logger.error(f"GitHub upload failed: {response.status} - {error_text}")
+                    return False, f"GitHub upload failed with status {response.status}."
 
         except Exception as e:
             self.logger.error(f"Backup failed: {e}", exc_info=True)
@@ -74,34 +97,34 @@ class GitHubBackupService:
             if zip_filepath and zip_filepath.exists():
                 zip_filepath.unlink()
 
-    async def list_backups(self) -> list:
+    async def list_backups(self, limit: Optional[int] = None) -> list:
+        """Returns backups newest first, or just the newest `limit` of them."""
         if not self.is_ready(): return []
         try:
             url = f"{self.base_url}/repos/{self.repo}/contents/backups"
-            headers = {'Authorization': f'token {self.token}', 'Accept': 'application/vnd.github.v3+json'}
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        files = await response.json()
-                        return sorted([f for f in files if f['name'].startswith('tika_backup_')], key=lambda x: x['name'], reverse=True)
-                    return []
+            async with self._get_session().get(url) as response:
+                if response.status == 200:
+                    files = orjson.loads(await response.read())
+                    backups = (f for f in files if f['name'].startswith('tika_backup_'))
+                    if limit is not None:
+                        return heapq.nlargest(limit, backups, key=lambda x: x['name'])
+                    return sorted(backups, key=lambda x: x['name'], reverse=True)
+                return []
         except Exception as e:
             self.logger.error(f"Failed to list backups: {e}")
             return []
 
     async def _delete_file(self, file_path: str, sha: str) -> bool:
         url = f"{self.base_url}/repos/{self.repo}/contents/{file_path}"
-        headers = {'Authorization': f'token {self.token}', 'Accept': 'application/vnd.github.v3+json'}
         data = {'message': f'Deleting old backup: {file_path}', 'sha': sha, 'branch': 'main'}
         try:
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.delete(url, json=data) as response:
-                    if response.status == 200:
-                        self.logger.info(f"Successfully deleted old backup: {file_path}")
-                        return True
-                    else:
-                        self.logger.warning(f"Failed to delete {file_path}: {response.status}")
-                        return False
+            async with self._get_session().delete(url, json=data) as response:
+                if response.status == 200:
+                    self.logger.info(f"Successfully deleted old backup: {file_path}")
+                    return True
+                else:
+                    self.logger.warning(f"Failed to delete {file_path}: {response.status}")
+                    return False
         except Exception:
             return False
 
@@ -110,7 +133,10 @@ class GitHubBackupService:
         if len(all_backups) <= keep_count:
             return 0
         
-        backups_to_delete = all_backups[keep_count:]
-        delete_tasks = [self._delete_file(backup['path'], backup['sha']) for backup in backups_to_delete]
-        results = await asyncio.gather(*delete_tasks)
-        return sum(1 for res in results if res)
\ No newline at end of file
+        # Each contents-API delete is a commit on the branch, so concurrent ones
+        # conflict (409); GitHub requires them to run one at a time.
+        deleted = 0
+        for backup in all_backups[keep_count:]:
+            if await self._delete_file(backup['path'], backup['sha']):
+                deleted += 1
+        return deleted
\ No newline at end of file